@@ -1,22 +1,45 @@
 """Summa Technologica scaffold package."""
 
-from .models import SummaResponse
-from .semantic_scholar import (
-    RetrievalResult,
-    SemanticScholarPaper,
-    build_dual_queries,
-    retrieve_grounded_papers,
-    search_semantic_scholar,
-    validate_citations_against_papers,
-)
-from .v2_contracts import (
-    ContractValidationError,
-    PipelineErrorContract,
-    build_partial_failure_payload,
-    parse_and_validate_v2_json,
-    validate_partial_failure_payload,
-    validate_v2_payload,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import SummaResponse
+    from .semantic_scholar import (
+        RetrievalResult,
+        SemanticScholarPaper,
+        build_dual_queries,
+        retrieve_grounded_papers,
+        search_semantic_scholar,
+        validate_citations_against_papers,
+    )
+    from .v2_contracts import (
+        ContractValidationError,
+        PipelineErrorContract,
+        build_partial_failure_payload,
+        parse_and_validate_v2_json,
+        validate_partial_failure_payload,
+        validate_v2_payload,
+    )
+
+# Public names resolved on first attribute access (PEP 562) so that importing
+# the package, or running `summa-technologica --help`, does not pull in the
+# retrieval client and contract validators up front.
+_LAZY_EXPORTS = {
+    "SummaResponse": ".models",
+    "RetrievalResult": ".semantic_scholar",
+    "SemanticScholarPaper": ".semantic_scholar",
+    "build_dual_queries": ".semantic_scholar",
+    "retrieve_grounded_papers": ".semantic_scholar",
+    "search_semantic_scholar": ".semantic_scholar",
+    "validate_citations_against_papers": ".semantic_scholar",
+    "ContractValidationError": ".v2_contracts",
+    "PipelineErrorContract": ".v2_contracts",
+    "build_partial_failure_payload": ".v2_contracts",
+    "parse_and_validate_v2_json": ".v2_contracts",
+    "validate_partial_failure_payload": ".v2_contracts",
+    "validate_v2_payload": ".v2_contracts",
+}
 
 
 def run_summa(*args, **kwargs):
@@ -33,9 +56,32 @@ def run_summa_v2(*args, **kwargs):
     return _run_summa_v2(*args, **kwargs)
 
 
+def run_summa_v2_batch(*args, **kwargs):
+    """Run summa v2 for several questions."""
+    from .crew_v2 import run_summa_v2_batch as _run_summa_v2_batch
+
+    return _run_summa_v2_batch(*args, **kwargs)
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names from their submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     "run_summa",
     "run_summa_v2",
+    "run_summa_v2_batch",
     "SummaResponse",
     "ContractValidationError",
     "PipelineErrorContract",
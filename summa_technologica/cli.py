@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import argparse
-import json
+from contextlib import nullcontext
+from itertools import chain
 from pathlib import Path
 import sys
+from typing import Iterable
 
 from .config import Settings
-from .formatter import to_markdown
-from .formatter_v2 import to_markdown_v2
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -67,9 +67,12 @@ def main() -> None:
         print("Error: question is required.", file=sys.stderr)
         raise SystemExit(2)
 
+    # Only import the pipeline (and its formatter below) for the selected mode.
     try:
-        from .crew import run_summa
-        from .crew_v2 import run_summa_v2
+        if args.mode == "v2":
+            from .crew_v2 import run_summa_v2
+        else:
+            from .crew import run_summa
     except ModuleNotFoundError as exc:
         if exc.name == "crewai":
             print(
@@ -99,17 +102,32 @@ def main() -> None:
         print(f"Error: {exc}", file=sys.stderr)
         raise SystemExit(1) from exc
 
-    if args.mode == "v2":
-        text = (
-            json.dumps(result, indent=2, ensure_ascii=True)
-            if args.format == "json"
-            else to_markdown_v2(result)
-        )
+    chunks: Iterable[str]
+    if args.format == "json":
+        if args.mode == "v2":
+            from .json_codec import dumps
+
+            chunks = [dumps(result, indent=True)]
+        else:
+            chunks = [result.to_json()]
+    elif args.mode == "v2":
+        from .formatter_v2 import iter_markdown_v2
+
+        chunks = iter_markdown_v2(result)
     else:
-        text = result.to_json() if args.format == "json" else to_markdown(result)
-    if args.save:
-        args.save.write_text(text + "\n", encoding="utf-8")
-    print(text)
+        from .formatter import to_markdown
+
+        chunks = [to_markdown(result)]
+    _write_output(chunks, save_path=args.save)
+
+
+def _write_output(chunks: Iterable[str], *, save_path: Path | None) -> None:
+    """Internal helper to stream output chunks to stdout and the optional save file."""
+    with save_path.open("w", encoding="utf-8") if save_path else nullcontext() as save_file:
+        for chunk in chain(chunks, ("\n",)):
+            sys.stdout.write(chunk)
+            if save_file is not None:
+                save_file.write(chunk)
 
 
 if __name__ == "__main__":
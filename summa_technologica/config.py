@@ -1,11 +1,14 @@
 """Settings — reads configuration from environment variables and .env file.
 
 All pipeline settings (which LLM model to use, API keys, default domain, etc.)
-are loaded here. The Settings dataclass is created once at the start of each
-pipeline run and passed to every stage.
+are loaded here. The .env file is applied on the first Settings.from_env() call
+rather than at import time. Settings.from_env() builds the Settings dataclass
+once per process and hands the same instance to every caller; tests that change
+the environment can call Settings.reset_cache() to force a re-read.
 """
 
 from dataclasses import dataclass
+import functools
 import os
 
 try:
@@ -15,7 +18,16 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for minimally provisi
         """Load dotenv."""
         return False
 
-load_dotenv()
+# Set once .env has been applied; inherited by subprocesses so they skip the file read.
+_DOTENV_SENTINEL = "SUMMA_DOTENV_LOADED"
+
+
+def _load_dotenv_once() -> None:
+    """Internal helper to apply .env at most once per process tree."""
+    if os.environ.get(_DOTENV_SENTINEL):
+        return
+    load_dotenv()
+    os.environ[_DOTENV_SENTINEL] = "1"
 
 
 def _as_bool(value: str, default: bool = False) -> bool:
@@ -25,7 +37,7 @@ def _as_bool(value: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     model: str
     creative_model: str
@@ -36,32 +48,43 @@ class Settings:
     semantic_scholar_base_url: str
     semantic_scholar_timeout_seconds: float
 
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Return process-wide settings, reading the environment only once."""
+        return _settings_from_env()
+
     @staticmethod
-    def from_env() -> "Settings":
-        """Load all runtime settings from environment variables."""
-        model = (
-            os.getenv("SUMMA_MODEL")
-            or os.getenv("MODEL")
-            or os.getenv("OPENAI_MODEL_NAME")
-            or os.getenv("OPENAI_MODEL")
-            or "gpt-4o-mini"
-        )
-        creative_model = os.getenv("CREATIVE_MODEL") or model
-        return Settings(
-            model=model,
-            creative_model=creative_model,
-            verbose=_as_bool(os.getenv("SUMMA_VERBOSE", "false")),
-            default_domain=os.getenv("SUMMA_DEFAULT_DOMAIN", "general science"),
-            default_objective=os.getenv(
-                "SUMMA_DEFAULT_OBJECTIVE",
-                "Brainstorm original, testable, high-leverage ideas.",
-            ),
-            semantic_scholar_api_key=os.getenv("SEMANTIC_SCHOLAR_API_KEY"),
-            semantic_scholar_base_url=os.getenv(
-                "SEMANTIC_SCHOLAR_BASE_URL",
-                "https://api.semanticscholar.org",
-            ),
-            semantic_scholar_timeout_seconds=float(
-                os.getenv("SEMANTIC_SCHOLAR_TIMEOUT_SECONDS", "20.0")
-            ),
-        )
+    def reset_cache() -> None:
+        """Drop the cached settings so the next from_env() re-reads the environment."""
+        _settings_from_env.cache_clear()
+
+
+# Model environment variables in precedence order; the first non-empty one wins.
+_MODEL_KEYS = ("SUMMA_MODEL", "MODEL", "OPENAI_MODEL_NAME", "OPENAI_MODEL")
+
+
+@functools.lru_cache(maxsize=1)
+def _settings_from_env() -> Settings:
+    """Load all runtime settings from environment variables."""
+    _load_dotenv_once()
+    env = os.environ
+    model = next(filter(None, (env.get(key) for key in _MODEL_KEYS)), "gpt-4o-mini")
+    creative_model = env.get("CREATIVE_MODEL") or model
+    return Settings(
+        model=model,
+        creative_model=creative_model,
+        verbose=_as_bool(env.get("SUMMA_VERBOSE", "false")),
+        default_domain=env.get("SUMMA_DEFAULT_DOMAIN", "general science"),
+        default_objective=env.get(
+            "SUMMA_DEFAULT_OBJECTIVE",
+            "Brainstorm original, testable, high-leverage ideas.",
+        ),
+        semantic_scholar_api_key=env.get("SEMANTIC_SCHOLAR_API_KEY"),
+        semantic_scholar_base_url=env.get(
+            "SEMANTIC_SCHOLAR_BASE_URL",
+            "https://api.semanticscholar.org",
+        ),
+        semantic_scholar_timeout_seconds=float(
+            env.get("SEMANTIC_SCHOLAR_TIMEOUT_SECONDS", "20.0")
+        ),
+    )
@@ -7,6 +7,11 @@ from typing import Any
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+try:
+    from crewai.crews.crew_output import CrewOutput
+except ImportError:  # pragma: no cover - crewai moved this class between releases
+    CrewOutput = None
+
 from .config import Settings
 from .models import SummaResponse, parse_summa_json
 
@@ -18,75 +23,77 @@ class SummaTechnologicaCrew:
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
 
-    @agent
-    def problem_formulator(self) -> Agent:
-        """Problem formulator."""
-        settings = Settings.from_env()
+    @property
+    def _settings(self) -> Settings:
+        """Process-wide settings shared by every agent and the crew."""
+        return Settings.from_env()
+
+    def _build_agent(self, key: str) -> Agent:
+        """Internal helper to build one YAML-configured agent.
+
+        Agents are rebuilt per crew rather than cached: CrewAI mutates agent
+        state (crew binding, tools, memory) during kickoff, so reusing one
+        across runs would leak state between questions.
+        """
+        settings = self._settings
         return Agent(
-            config=self.agents_config["problem_formulator"],
+            config=self.agents_config[key],
             llm=settings.model,
             verbose=settings.verbose,
         )
 
+    def _build_task(self, key: str) -> Task:
+        """Internal helper to build one YAML-configured task."""
+        return Task(config=self.tasks_config[key])
+
+    @agent
+    def problem_formulator(self) -> Agent:
+        """Problem formulator."""
+        return self._build_agent("problem_formulator")
+
     @agent
     def objection_engineer(self) -> Agent:
         """Objection engineer."""
-        settings = Settings.from_env()
-        return Agent(
-            config=self.agents_config["objection_engineer"],
-            llm=settings.model,
-            verbose=settings.verbose,
-        )
+        return self._build_agent("objection_engineer")
 
     @agent
     def respondeo_author(self) -> Agent:
         """Respondeo author."""
-        settings = Settings.from_env()
-        return Agent(
-            config=self.agents_config["respondeo_author"],
-            llm=settings.model,
-            verbose=settings.verbose,
-        )
+        return self._build_agent("respondeo_author")
 
     @agent
     def scholastic_editor(self) -> Agent:
         """Scholastic editor."""
-        settings = Settings.from_env()
-        return Agent(
-            config=self.agents_config["scholastic_editor"],
-            llm=settings.model,
-            verbose=settings.verbose,
-        )
+        return self._build_agent("scholastic_editor")
 
     @task
     def formulate_problem_task(self) -> Task:
         """Formulate problem task."""
-        return Task(config=self.tasks_config["formulate_problem_task"])
+        return self._build_task("formulate_problem_task")
 
     @task
     def generate_objections_task(self) -> Task:
         """Generate objections task."""
-        return Task(config=self.tasks_config["generate_objections_task"])
+        return self._build_task("generate_objections_task")
 
     @task
     def draft_summa_task(self) -> Task:
         """Draft summa task."""
-        return Task(config=self.tasks_config["draft_summa_task"])
+        return self._build_task("draft_summa_task")
 
     @task
     def quality_gate_task(self) -> Task:
         """Quality gate task."""
-        return Task(config=self.tasks_config["quality_gate_task"])
+        return self._build_task("quality_gate_task")
 
     @crew
     def crew(self) -> Crew:
         """Crew."""
-        settings = Settings.from_env()
         return Crew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=settings.verbose,
+            verbose=self._settings.verbose,
         )
 
 
@@ -122,6 +129,13 @@ def _extract_raw_output(output: Any) -> str:
     if isinstance(output, str):
         return output
 
+    if CrewOutput is not None and isinstance(output, CrewOutput):
+        if output.raw.strip():
+            return output.raw
+        if output.tasks_output and output.tasks_output[-1].raw.strip():
+            return output.tasks_output[-1].raw
+        return str(output)
+
     raw = getattr(output, "raw", None)
     if isinstance(raw, str) and raw.strip():
         return raw
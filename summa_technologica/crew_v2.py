@@ -24,10 +24,12 @@ Files this module depends on:
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+import functools
 from pathlib import Path
 import time
-from typing import Any
+from typing import Any, Callable, Sequence
 
 from .config import Settings
 from .crew_v2_postprocess import (
@@ -50,7 +52,11 @@ from .crew_v2_stages import (
     _run_stage_with_retry,
     _run_summa_composer_stage,
 )
-from .semantic_scholar import RetrievalResult, retrieve_grounded_papers
+from .semantic_scholar import (
+    SemanticScholarPaper,
+    retrieve_grounded_papers,
+    search_semantic_scholar,
+)
 from .v2_contracts import (
     ContractValidationError,
     PipelineErrorContract,
@@ -58,6 +64,12 @@ from .v2_contracts import (
     validate_v2_payload,
 )
 
+CONFIG_DIR = Path(__file__).with_name("config")
+DIVERSITY_SUFFIX = (
+    " Hard constraint: produce at least 3 genuinely distinct hypotheses "
+    "across mechanism, empirical domain, or theoretical framework."
+)
+
 
 def run_summa_v2(
     question: str,
@@ -79,8 +91,8 @@ def run_summa_v2(
     if not cleaned_objective:
         cleaned_objective = settings.default_objective
 
-    agents_cfg = _load_yaml_config(Path(__file__).with_name("config") / "agents_v2.yaml")
-    tasks_cfg = _load_yaml_config(Path(__file__).with_name("config") / "tasks_v2.yaml")
+    agents_cfg = _load_yaml_config(CONFIG_DIR / "agents_v2.yaml")
+    tasks_cfg = _load_yaml_config(CONFIG_DIR / "tasks_v2.yaml")
 
     stage_outputs: dict[str, Any] = {}
     stage_durations: dict[str, float] = {}
@@ -88,6 +100,16 @@ def run_summa_v2(
     ranked_ids: list[str] = []
     summa_rendering = ""
 
+    inputs_base = {
+        "question": cleaned_question,
+        "domain": cleaned_domain,
+        "objective": cleaned_objective,
+    }
+
+    # The raw-question search does not depend on problem_framer, so start it
+    # now and let the network round-trip overlap with the first LLM call.
+    raw_query_prefetch = _prefetch_raw_question_search(cleaned_question, settings)
+
     try:
         stage_started = time.monotonic()
         problem_memo = _run_stage_with_retry(
@@ -96,11 +118,7 @@ def run_summa_v2(
                 agent_cfg=agents_cfg["problem_framer"],
                 task_cfg=tasks_cfg["problem_framer_task"],
                 settings=settings,
-                inputs={
-                    "question": cleaned_question,
-                    "domain": cleaned_domain,
-                    "objective": cleaned_objective,
-                },
+                inputs=inputs_base,
                 retry_error=retry_error,
             ),
         )
@@ -116,9 +134,15 @@ def run_summa_v2(
             api_key=settings.semantic_scholar_api_key,
             per_query_limit=10,
             timeout_seconds=settings.semantic_scholar_timeout_seconds,
+            prefetched=_collect_prefetch(cleaned_question, raw_query_prefetch),
         )
         stage_durations["retrieval"] = round(time.monotonic() - stage_started, 3)
-        stage_outputs["retrieval"] = retrieval_result.to_dict()
+        retrieval_dict = retrieval_result.to_dict()
+        stage_outputs["retrieval"] = retrieval_dict
+
+        # These payloads feed several prompts (including retries); serialize once.
+        problem_memo_json = _as_json(problem_memo)
+        retrieval_json = _as_json(retrieval_dict)
 
         stage_started = time.monotonic()
         evidence_memo = _run_stage_with_retry(
@@ -129,8 +153,8 @@ def run_summa_v2(
                 settings=settings,
                 inputs={
                     "domain": cleaned_domain,
-                    "problem_memo_json": _as_json(problem_memo),
-                    "retrieval_json": _as_json(retrieval_result.to_dict()),
+                    "problem_memo_json": problem_memo_json,
+                    "retrieval_json": retrieval_json,
                 },
                 retry_error=retry_error,
             ),
@@ -139,6 +163,12 @@ def run_summa_v2(
         stage_outputs["literature_scout"] = evidence_memo
 
         stage_started = time.monotonic()
+        # Also reused (with a stricter objective) by the diversity retries.
+        generator_inputs = inputs_base | {
+            "problem_memo_json": problem_memo_json,
+            "evidence_memo_json": _as_json(evidence_memo),
+            "retrieval_json": retrieval_json,
+        }
         generator_output = _run_stage_with_retry(
             stage_name="hypothesis_generator",
             run_once=lambda retry_error: _run_json_stage(
@@ -146,14 +176,7 @@ def run_summa_v2(
                 task_cfg=tasks_cfg["hypothesis_generator_task"],
                 settings=settings,
                 model_override=settings.creative_model,
-                inputs={
-                    "question": cleaned_question,
-                    "domain": cleaned_domain,
-                    "objective": cleaned_objective,
-                    "problem_memo_json": _as_json(problem_memo),
-                    "evidence_memo_json": _as_json(evidence_memo),
-                    "retrieval_json": _as_json(retrieval_result.to_dict()),
-                },
+                inputs=generator_inputs,
                 retry_error=retry_error,
             ),
         )
@@ -163,27 +186,28 @@ def run_summa_v2(
             generator_output,
             retrieval_result.papers,
         )
-        diversity_issues = _check_novelty_diversity(normalized_hypotheses)
-        if len(normalized_hypotheses) < 3 or diversity_issues:
-            stage_started = time.monotonic()
-            normalized_hypotheses = _regenerate_for_diversity(
-                settings=settings,
-                agents_cfg=agents_cfg,
-                tasks_cfg=tasks_cfg,
-                question=cleaned_question,
-                domain=cleaned_domain,
-                objective=cleaned_objective,
-                problem_memo=problem_memo,
-                evidence_memo=evidence_memo,
-                retrieval_result=retrieval_result,
-                stage_outputs=stage_outputs,
-            )
-            stage_durations["hypothesis_generator_diversity_retry"] = round(
-                time.monotonic() - stage_started, 3
-            )
-            diversity_issues = _check_novelty_diversity(normalized_hypotheses)
+        regenerate = functools.partial(
+            _regenerate_for_diversity,
+            settings=settings,
+            agents_cfg=agents_cfg,
+            tasks_cfg=tasks_cfg,
+            generator_inputs=generator_inputs,
+            grounded_papers=retrieval_result.papers,
+            stage_outputs=stage_outputs,
+        )
+        normalized_hypotheses, diversity_issues = _ensure_diversity(
+            normalized_hypotheses,
+            regenerate=regenerate,
+            stage_durations=stage_durations,
+            duration_key="hypothesis_generator_diversity_retry",
+        )
 
         stage_started = time.monotonic()
+        critic_inputs = {
+            "question": cleaned_question,
+            "domain": cleaned_domain,
+            "hypotheses_json": _as_json({"hypotheses": normalized_hypotheses}),
+        }
         critic_output = _run_stage_with_retry(
             stage_name="critic",
             run_once=lambda retry_error: _run_json_stage(
@@ -191,58 +215,43 @@ def run_summa_v2(
                 task_cfg=tasks_cfg["critic_task"],
                 settings=settings,
                 model_override=settings.creative_model,
-                inputs={
-                    "question": cleaned_question,
-                    "domain": cleaned_domain,
-                    "hypotheses_json": _as_json({"hypotheses": normalized_hypotheses}),
-                },
+                inputs=critic_inputs,
                 retry_error=retry_error,
             ),
         )
         stage_durations["critic"] = round(time.monotonic() - stage_started, 3)
         stage_outputs["critic"] = critic_output
+        pre_critic_hypotheses = normalized_hypotheses
         normalized_hypotheses = _normalize_critic_hypotheses(
             critic_output,
-            fallback=normalized_hypotheses,
+            fallback=pre_critic_hypotheses,
             grounded_papers=retrieval_result.papers,
         )
-
-        diversity_issues = _check_novelty_diversity(normalized_hypotheses)
-        if len(normalized_hypotheses) < 3 or diversity_issues:
-            stage_started = time.monotonic()
-            normalized_hypotheses = _regenerate_for_diversity(
-                settings=settings,
-                agents_cfg=agents_cfg,
-                tasks_cfg=tasks_cfg,
-                question=cleaned_question,
-                domain=cleaned_domain,
-                objective=cleaned_objective,
-                problem_memo=problem_memo,
-                evidence_memo=evidence_memo,
-                retrieval_result=retrieval_result,
-                stage_outputs=stage_outputs,
-            )
-            stage_durations["hypothesis_generator_diversity_retry_after_critic"] = round(
-                time.monotonic() - stage_started, 3
-            )
-            diversity_issues = _check_novelty_diversity(normalized_hypotheses)
+        normalized_hypotheses, diversity_issues = _ensure_diversity(
+            normalized_hypotheses,
+            fallback=pre_critic_hypotheses,
+            regenerate=regenerate,
+            stage_durations=stage_durations,
+            duration_key="hypothesis_generator_diversity_retry_after_critic",
+        )
 
         stage_started = time.monotonic()
+        ranker_inputs = {
+            "domain": cleaned_domain,
+            "critic_json": _as_json(
+                {
+                    "hypotheses": normalized_hypotheses,
+                    "distinctness_matrix": critic_output.get("distinctness_matrix", []),
+                }
+            ),
+        }
         ranker_output = _run_stage_with_retry(
             stage_name="ranker",
             run_once=lambda retry_error: _run_json_stage(
                 agent_cfg=agents_cfg["ranker"],
                 task_cfg=tasks_cfg["ranker_task"],
                 settings=settings,
-                inputs={
-                    "domain": cleaned_domain,
-                    "critic_json": _as_json(
-                        {
-                            "hypotheses": normalized_hypotheses,
-                            "distinctness_matrix": critic_output.get("distinctness_matrix", []),
-                        }
-                    ),
-                },
+                inputs=ranker_inputs,
                 retry_error=retry_error,
             ),
         )
@@ -256,6 +265,16 @@ def run_summa_v2(
         normalized_hypotheses = _hydrate_summa_triplets(hypotheses_with_scores)
 
         stage_started = time.monotonic()
+        # Shared by the composer stage, its retry, and the post-validation retry.
+        composer_inputs = {
+            "question": cleaned_question,
+            "domain": cleaned_domain,
+            "top_hypotheses_json": _as_json(
+                _top_hypotheses(normalized_hypotheses, ranked_ids, top)
+            ),
+            "ranking_json": _as_json({"ranked_hypothesis_ids": ranked_ids}),
+            "top_count": str(top),
+        }
         composer_output = _run_stage_with_retry(
             stage_name="summa_composer",
             run_once=lambda retry_error: _run_summa_composer_stage(
@@ -263,15 +282,7 @@ def run_summa_v2(
                 task_cfg=tasks_cfg["summa_composer_task"],
                 settings=settings,
                 model_override=settings.creative_model,
-                inputs={
-                    "question": cleaned_question,
-                    "domain": cleaned_domain,
-                    "top_hypotheses_json": _as_json(
-                        _top_hypotheses(normalized_hypotheses, ranked_ids, top)
-                    ),
-                    "ranking_json": _as_json({"ranked_hypothesis_ids": ranked_ids}),
-                    "top_count": str(top),
-                },
+                inputs=composer_inputs,
                 retry_error=retry_error,
             ),
         )
@@ -329,21 +340,18 @@ def run_summa_v2(
         try:
             validate_v2_payload(final_payload, grounded_papers=retrieval_result.papers)
         except ContractValidationError as exc:
+            # The composer only contributes summa_rendering, which
+            # _ensure_summa_rendering already repaired; when it is present the
+            # failure lies in upstream fields a second composer call cannot fix.
+            if final_payload["summa_rendering"].strip():
+                raise
             stage_started = time.monotonic()
             composer_retry = _run_summa_composer_stage(
                 agent_cfg=agents_cfg["summa_composer"],
                 task_cfg=tasks_cfg["summa_composer_task"],
                 settings=settings,
                 model_override=settings.creative_model,
-                inputs={
-                    "question": cleaned_question,
-                    "domain": cleaned_domain,
-                    "top_hypotheses_json": _as_json(
-                        _top_hypotheses(normalized_hypotheses, ranked_ids, top)
-                    ),
-                    "ranking_json": _as_json({"ranked_hypothesis_ids": ranked_ids}),
-                    "top_count": str(top),
-                },
+                inputs=composer_inputs,
                 retry_error=f"Final payload validation failed: {exc}",
             )
             stage_durations["summa_composer_retry"] = round(time.monotonic() - stage_started, 3)
@@ -377,25 +385,113 @@ def run_summa_v2(
         )
 
 
+def run_summa_v2_batch(
+    questions: Sequence[str],
+    *,
+    domain: str | None = None,
+    objective: str | None = None,
+    top: int = 1,
+    max_workers: int = 4,
+) -> list[dict[str, Any]]:
+    """Run the V2 pipeline for several questions concurrently, in input order.
+
+    Each question still gets its own stage calls; the pipelines simply overlap
+    their LLM and retrieval waits, bounded by max_workers.
+    """
+    if not questions:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(questions))),
+        thread_name_prefix="summa-batch",
+    ) as executor:
+        futures = [
+            executor.submit(
+                run_summa_v2,
+                question,
+                domain=domain,
+                objective=objective,
+                top=top,
+            )
+            for question in questions
+        ]
+        return [future.result() for future in futures]
+
+
+def _prefetch_raw_question_search(
+    question: str,
+    settings: Settings,
+) -> Future[list[SemanticScholarPaper]]:
+    """Internal helper to start the raw-question Semantic Scholar search in the background."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summa-prefetch")
+    try:
+        return executor.submit(
+            search_semantic_scholar,
+            question,
+            base_url=settings.semantic_scholar_base_url,
+            api_key=settings.semantic_scholar_api_key,
+            limit=10,
+            timeout_seconds=settings.semantic_scholar_timeout_seconds,
+        )
+    finally:
+        # Lets the submitted search finish without keeping the pool alive.
+        executor.shutdown(wait=False)
+
+
+def _collect_prefetch(
+    question: str,
+    future: Future[list[SemanticScholarPaper]],
+) -> dict[str, list[SemanticScholarPaper]]:
+    """Internal helper to collect prefetched papers keyed by query.
+
+    A failed prefetch is dropped so retrieval re-issues the query and records
+    the error through its normal path.
+    """
+    try:
+        return {question: future.result()}
+    except Exception:
+        return {}
+
+
+def _ensure_diversity(
+    hypotheses: list[dict[str, Any]],
+    *,
+    regenerate: Callable[[], list[dict[str, Any]]],
+    stage_durations: dict[str, float],
+    duration_key: str,
+    fallback: list[dict[str, Any]] | None = None,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Return at least 3 distinct hypotheses and their remaining diversity issues.
+
+    A sufficient fallback (the pre-critic set) is preferred over regenerating,
+    which costs another LLM call.
+    """
+    issues = _check_novelty_diversity(hypotheses)
+    if len(hypotheses) >= 3 and not issues:
+        return hypotheses, issues
+    if fallback is not None and len(fallback) >= 3:
+        fallback_issues = _check_novelty_diversity(fallback)
+        if not fallback_issues:
+            return fallback, fallback_issues
+
+    stage_started = time.monotonic()
+    regenerated = regenerate()
+    stage_durations[duration_key] = round(time.monotonic() - stage_started, 3)
+    return regenerated, _check_novelty_diversity(regenerated)
+
+
 def _regenerate_for_diversity(
     *,
     settings: Settings,
     agents_cfg: dict[str, Any],
     tasks_cfg: dict[str, Any],
-    question: str,
-    domain: str,
-    objective: str,
-    problem_memo: dict[str, Any],
-    evidence_memo: dict[str, Any],
-    retrieval_result: RetrievalResult,
+    generator_inputs: dict[str, str],
+    grounded_papers: list[SemanticScholarPaper],
     stage_outputs: dict[str, Any],
 ) -> list[dict[str, Any]]:
     """Internal helper to regenerate for diversity."""
-    diversity_objective = (
-        objective
-        + " Hard constraint: produce at least 3 genuinely distinct hypotheses "
-        + "across mechanism, empirical domain, or theoretical framework."
-    )
+    diversity_inputs = generator_inputs | {
+        "objective": generator_inputs["objective"] + DIVERSITY_SUFFIX,
+    }
     regenerated = _run_stage_with_retry(
         stage_name="hypothesis_generator_diversity_retry",
         run_once=lambda retry_error: _run_json_stage(
@@ -403,19 +499,12 @@ def _regenerate_for_diversity(
             task_cfg=tasks_cfg["hypothesis_generator_task"],
             settings=settings,
             model_override=settings.creative_model,
-            inputs={
-                "question": question,
-                "domain": domain,
-                "objective": diversity_objective,
-                "problem_memo_json": _as_json(problem_memo),
-                "evidence_memo_json": _as_json(evidence_memo),
-                "retrieval_json": _as_json(retrieval_result.to_dict()),
-            },
+            inputs=diversity_inputs,
             retry_error=retry_error,
         ),
     )
     stage_outputs["hypothesis_generator_diversity_retry"] = regenerated
-    normalized = _normalize_generated_hypotheses(regenerated, retrieval_result.papers)
+    normalized = _normalize_generated_hypotheses(regenerated, grounded_papers)
     if len(normalized) < 3:
         raise _StageFailure(
             stage="hypothesis_generator_diversity_retry",
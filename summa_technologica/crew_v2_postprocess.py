@@ -16,11 +16,63 @@ to clean up the output before passing it to the next stage.
 
 from __future__ import annotations
 
-import json
+from dataclasses import dataclass
 import re
 from typing import Any
 
-from .semantic_scholar import SemanticScholarPaper
+from . import json_codec
+from .semantic_scholar import SemanticScholarPaper, _normalize_doi
+
+
+# Hypotheses past this many are dropped, so they are never normalized.
+_MAX_HYPOTHESES = 5
+
+_DIMENSIONS = ("novelty", "plausibility", "testability")
+_WINNER_KEYS = tuple(f"winner_{dimension}" for dimension in _DIMENSIONS)
+_VALID_WINNERS = frozenset(("a", "b", "tie"))
+# Weight of each entry of _DIMENSIONS in a hypothesis's overall score.
+_SCORE_WEIGHTS = (0.35, 0.30, 0.35)
+
+# Summa rendering structure: blocks are separated by a '---' line, and each
+# block must mention every marker (compared lowercased).
+_BLOCK_SEP_RE = re.compile(r"\n\s*---\s*\n")
+_REQUIRED_MARKERS = (
+    "question:",
+    "objections:",
+    "on the contrary",
+    "i answer that",
+    "replies to objections",
+)
+
+# Text fields copied from model output, with the fallback used when a field is
+# missing or blank. Order matches the key order of normalized hypotheses.
+_HYPOTHESIS_TEXT_FIELDS = (
+    ("statement", "No statement provided."),
+    ("mechanism_cause", "Mechanism cause not provided."),
+    ("mechanism_substrate", "Mechanism substrate not provided."),
+    ("mechanism_intervention", "Mechanism intervention not provided."),
+    ("mechanism_signal", "Mechanism signal not provided."),
+    ("novelty_rationale", "Novelty rationale unavailable."),
+    ("plausibility_rationale", "Plausibility rationale unavailable."),
+    ("testability_rationale", "Testability rationale unavailable."),
+)
+_HYPOTHESIS_LIST_FIELDS = (
+    ("falsifiable_predictions", "Prediction not provided."),
+    ("minimal_experiments", "Experiment plan not provided."),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _GroundingIndex:
+    """Per-stage view of the retrieved papers used while normalizing hypotheses.
+
+    Holds paper ids and normalized DOIs for O(1) citation checks, plus the
+    fallback citations given to hypotheses that cite nothing valid.
+    """
+
+    valid_ids: frozenset[str]
+    valid_dois: frozenset[str]
+    fallback_citations: tuple[dict[str, Any], ...]
 
 
 def _normalize_generated_hypotheses(
@@ -32,10 +84,13 @@ def _normalize_generated_hypotheses(
     if not isinstance(raw, list):
         raise ValueError("Generator output must include hypotheses array.")
 
+    grounding = _build_grounding_index(grounded_papers)
     normalized: list[dict[str, Any]] = []
     seen_ids: set[str] = set()
     fallback_counter = 1
     for item in raw:
+        if len(normalized) >= _MAX_HYPOTHESES:
+            break
         if not isinstance(item, dict):
             continue
         hypothesis_id = _as_id(item.get("id"), fallback_counter)
@@ -45,57 +100,9 @@ def _normalize_generated_hypotheses(
         seen_ids.add(hypothesis_id)
         fallback_counter += 1
 
-        citations = _sanitize_citations(item.get("citations"), grounded_papers)
-        if not citations:
-            citations = _fallback_grounded_citations(grounded_papers)
-
-        hypothesis = {
-            "id": hypothesis_id,
-            "title": _as_nonempty_text(item.get("title"), f"Hypothesis {hypothesis_id}"),
-            "statement": _as_nonempty_text(item.get("statement"), "No statement provided."),
-            "mechanism_cause": _as_nonempty_text(
-                item.get("mechanism_cause"),
-                "Mechanism cause not provided.",
-            ),
-            "mechanism_substrate": _as_nonempty_text(
-                item.get("mechanism_substrate"),
-                "Mechanism substrate not provided.",
-            ),
-            "mechanism_intervention": _as_nonempty_text(
-                item.get("mechanism_intervention"),
-                "Mechanism intervention not provided.",
-            ),
-            "mechanism_signal": _as_nonempty_text(
-                item.get("mechanism_signal"),
-                "Mechanism signal not provided.",
-            ),
-            "novelty_rationale": _as_nonempty_text(
-                item.get("novelty_rationale"),
-                "Novelty rationale unavailable.",
-            ),
-            "plausibility_rationale": _as_nonempty_text(
-                item.get("plausibility_rationale"),
-                "Plausibility rationale unavailable.",
-            ),
-            "testability_rationale": _as_nonempty_text(
-                item.get("testability_rationale"),
-                "Testability rationale unavailable.",
-            ),
-            "falsifiable_predictions": _normalize_text_list(
-                item.get("falsifiable_predictions"),
-                fallback="Prediction not provided.",
-            ),
-            "minimal_experiments": _normalize_text_list(
-                item.get("minimal_experiments"),
-                fallback="Experiment plan not provided.",
-            ),
-            "citations": citations,
-            "objections": _ensure_objections(item.get("objections")),
-            "replies": _ensure_replies(item.get("replies")),
-        }
-        normalized.append(hypothesis)
+        normalized.append(_build_hypothesis(item, hypothesis_id, grounding))
 
-    return normalized[:5]
+    return normalized
 
 
 def _normalize_critic_hypotheses(
@@ -109,74 +116,52 @@ def _normalize_critic_hypotheses(
     if not isinstance(raw, list) or not raw:
         hypotheses = fallback
     else:
+        grounding = _build_grounding_index(grounded_papers)
         hypotheses = []
         seen_ids: set[str] = set()
         for item in raw:
+            if len(hypotheses) >= _MAX_HYPOTHESES:
+                break
             if not isinstance(item, dict):
                 continue
             hypothesis_id = _as_nonempty_text(item.get("id"), "")
             if not hypothesis_id or hypothesis_id in seen_ids:
                 continue
             seen_ids.add(hypothesis_id)
-            citations = _sanitize_citations(item.get("citations"), grounded_papers)
-            if not citations:
-                citations = _fallback_grounded_citations(grounded_papers)
-            hypotheses.append(
-                {
-                    "id": hypothesis_id,
-                    "title": _as_nonempty_text(item.get("title"), f"Hypothesis {hypothesis_id}"),
-                    "statement": _as_nonempty_text(item.get("statement"), "No statement provided."),
-                    "mechanism_cause": _as_nonempty_text(
-                        item.get("mechanism_cause"),
-                        "Mechanism cause not provided.",
-                    ),
-                    "mechanism_substrate": _as_nonempty_text(
-                        item.get("mechanism_substrate"),
-                        "Mechanism substrate not provided.",
-                    ),
-                    "mechanism_intervention": _as_nonempty_text(
-                        item.get("mechanism_intervention"),
-                        "Mechanism intervention not provided.",
-                    ),
-                    "mechanism_signal": _as_nonempty_text(
-                        item.get("mechanism_signal"),
-                        "Mechanism signal not provided.",
-                    ),
-                    "novelty_rationale": _as_nonempty_text(
-                        item.get("novelty_rationale"),
-                        "Novelty rationale unavailable.",
-                    ),
-                    "plausibility_rationale": _as_nonempty_text(
-                        item.get("plausibility_rationale"),
-                        "Plausibility rationale unavailable.",
-                    ),
-                    "testability_rationale": _as_nonempty_text(
-                        item.get("testability_rationale"),
-                        "Testability rationale unavailable.",
-                    ),
-                    "falsifiable_predictions": _normalize_text_list(
-                        item.get("falsifiable_predictions"),
-                        fallback="Prediction not provided.",
-                    ),
-                    "minimal_experiments": _normalize_text_list(
-                        item.get("minimal_experiments"),
-                        fallback="Experiment plan not provided.",
-                    ),
-                    "citations": citations,
-                    "objections": _ensure_objections(item.get("objections")),
-                    "replies": _ensure_replies(item.get("replies")),
-                }
-            )
+            hypotheses.append(_build_hypothesis(item, hypothesis_id, grounding))
 
     if not hypotheses:
         raise ValueError("Critic output did not provide any usable hypotheses.")
 
+    hypotheses = hypotheses[:_MAX_HYPOTHESES]
     for hypothesis in hypotheses:
         if "objections" not in hypothesis:
             hypothesis["objections"] = _ensure_objections(None)
         if "replies" not in hypothesis:
             hypothesis["replies"] = _ensure_replies(None)
-    return hypotheses[:5]
+    return hypotheses
+
+
+def _build_hypothesis(
+    item: dict[str, Any],
+    hypothesis_id: str,
+    grounding: _GroundingIndex,
+) -> dict[str, Any]:
+    """Internal helper to build one normalized hypothesis from a raw model item."""
+    hypothesis: dict[str, Any] = {
+        "id": hypothesis_id,
+        "title": _as_nonempty_text(item.get("title"), f"Hypothesis {hypothesis_id}"),
+    }
+    for field, fallback in _HYPOTHESIS_TEXT_FIELDS:
+        hypothesis[field] = _as_nonempty_text(item.get(field), fallback)
+    for field, fallback in _HYPOTHESIS_LIST_FIELDS:
+        hypothesis[field] = _normalize_text_list(item.get(field), fallback=fallback)
+
+    citations = _sanitize_citations(item.get("citations"), grounding)
+    hypothesis["citations"] = citations or list(grounding.fallback_citations)
+    hypothesis["objections"] = _ensure_objections(item.get("objections"))
+    hypothesis["replies"] = _ensure_replies(item.get("replies"))
+    return hypothesis
 
 
 def _check_novelty_diversity(hypotheses: list[dict[str, Any]]) -> list[str]:
@@ -212,7 +197,7 @@ def _check_novelty_diversity(hypotheses: list[dict[str, Any]]) -> list[str]:
 
 def _validate_prediction_specificity(predictions: list[str]) -> dict[str, Any]:
     """Score prediction specificity and surface vague predictions for follow-up."""
-    cleaned_predictions = [str(item).strip() for item in predictions if str(item).strip()]
+    cleaned_predictions = [text for item in predictions if (text := str(item).strip())]
     if not cleaned_predictions:
         return {
             "total": 0,
@@ -292,12 +277,23 @@ def _apply_pairwise_ranking(
     hypotheses: list[dict[str, Any]],
     ranker_output: dict[str, Any],
 ) -> tuple[list[str], list[dict[str, Any]]]:
-    """Internal helper to apply pairwise ranking."""
+    """Internal helper to apply pairwise ranking.
+
+    Scores and pairwise records are attached to the given hypothesis dicts in
+    place; the returned list holds those same dicts in input order.
+    """
     ids = [item["id"] for item in hypotheses]
     comparisons = ranker_output.get("comparisons")
     if not isinstance(comparisons, list):
         raise ValueError("Ranker output must contain a comparisons array.")
 
+    # Tallies are positional: one row per hypothesis (in ids order), one column
+    # per entry of _DIMENSIONS. They are accumulated while comparisons are
+    # normalized, so the comparison list is walked only once.
+    position = {hypothesis_id: index for index, hypothesis_id in enumerate(ids)}
+    wins = [[0, 0, 0] for _ in ids]
+    points = [[0.0, 0.0, 0.0] for _ in ids]
+
     normalized_comparisons: list[dict[str, Any]] = []
     seen_pairs: set[tuple[str, str]] = set()
     for item in comparisons:
@@ -305,70 +301,67 @@ def _apply_pairwise_ranking(
             continue
         a = _as_nonempty_text(item.get("hypothesis_a_id"), "")
         b = _as_nonempty_text(item.get("hypothesis_b_id"), "")
-        if not a or not b or a == b or a not in ids or b not in ids:
+        if not a or not b or a == b or a not in position or b not in position:
             continue
-        pair = tuple(sorted([a, b]))
+        pair = (a, b) if a < b else (b, a)
         if pair in seen_pairs:
             continue
         seen_pairs.add(pair)
+        winners = [_winner(item.get(winner_key)) for winner_key in _WINNER_KEYS]
         normalized_comparisons.append(
-            {
-                "hypothesis_a_id": a,
-                "hypothesis_b_id": b,
-                "winner_novelty": _winner(item.get("winner_novelty")),
-                "winner_plausibility": _winner(item.get("winner_plausibility")),
-                "winner_testability": _winner(item.get("winner_testability")),
-            }
+            {"hypothesis_a_id": a, "hypothesis_b_id": b, **dict(zip(_WINNER_KEYS, winners))}
         )
 
-    expected_pairs = {
-        tuple(sorted([ids[i], ids[j]]))
-        for i in range(len(ids))
-        for j in range(i + 1, len(ids))
-    }
-    for pair in sorted(expected_pairs):
-        if pair not in seen_pairs:
+        a_wins, a_points = wins[position[a]], points[position[a]]
+        b_wins, b_points = wins[position[b]], points[position[b]]
+        for column, winner in enumerate(winners):
+            if winner == "a":
+                a_wins[column] += 1
+                a_points[column] += 1.0
+            elif winner == "b":
+                b_wins[column] += 1
+                b_points[column] += 1.0
+            else:
+                a_points[column] += 0.5
+                b_points[column] += 0.5
+
+    # Walking the sorted ids with i < j yields every pair already ordered and in
+    # lexicographic order, so missing pairs are stubbed in a stable order. A
+    # stub is a tie on every dimension.
+    sorted_ids = sorted(ids)
+    for i, first_id in enumerate(sorted_ids):
+        for second_id in sorted_ids[i + 1 :]:
+            pair = (first_id, second_id)
+            if pair in seen_pairs:
+                continue
+            seen_pairs.add(pair)
             normalized_comparisons.append(
                 {
-                    "hypothesis_a_id": pair[0],
-                    "hypothesis_b_id": pair[1],
+                    "hypothesis_a_id": first_id,
+                    "hypothesis_b_id": second_id,
                     "winner_novelty": "tie",
                     "winner_plausibility": "tie",
                     "winner_testability": "tie",
                 }
             )
-
-    wins: dict[str, dict[str, int]] = {
-        hypothesis_id: {"novelty": 0, "plausibility": 0, "testability": 0}
-        for hypothesis_id in ids
-    }
-    points: dict[str, dict[str, float]] = {
-        hypothesis_id: {"novelty": 0.0, "plausibility": 0.0, "testability": 0.0}
-        for hypothesis_id in ids
-    }
-    for comparison in normalized_comparisons:
-        a = comparison["hypothesis_a_id"]
-        b = comparison["hypothesis_b_id"]
-        _accumulate_win(wins, "novelty", comparison["winner_novelty"], a, b)
-        _accumulate_win(wins, "plausibility", comparison["winner_plausibility"], a, b)
-        _accumulate_win(wins, "testability", comparison["winner_testability"], a, b)
-        _accumulate_points(points, "novelty", comparison["winner_novelty"], a, b)
-        _accumulate_points(points, "plausibility", comparison["winner_plausibility"], a, b)
-        _accumulate_points(points, "testability", comparison["winner_testability"], a, b)
+            for row in (points[position[first_id]], points[position[second_id]]):
+                row[0] += 0.5
+                row[1] += 0.5
+                row[2] += 0.5
 
     divisor = max(len(ids) - 1, 1)
     scores_by_id: dict[str, dict[str, float]] = {}
-    for hypothesis_id in ids:
-        novelty = 1 + 4 * (points[hypothesis_id]["novelty"] / divisor)
-        plausibility = 1 + 4 * (points[hypothesis_id]["plausibility"] / divisor)
-        testability = 1 + 4 * (points[hypothesis_id]["testability"] / divisor)
-        overall = 0.35 * novelty + 0.30 * plausibility + 0.35 * testability
-        scores_by_id[hypothesis_id] = {
-            "novelty": round(novelty, 3),
-            "plausibility": round(plausibility, 3),
-            "testability": round(testability, 3),
-            "overall": round(overall, 3),
+    for hypothesis_id, row in zip(ids, points):
+        dimension_scores = [1 + 4 * (value / divisor) for value in row]
+        overall = sum(
+            weight * score for weight, score in zip(_SCORE_WEIGHTS, dimension_scores)
+        )
+        scores = {
+            dimension: round(score, 3)
+            for dimension, score in zip(_DIMENSIONS, dimension_scores)
         }
+        scores["overall"] = round(overall, 3)
+        scores_by_id[hypothesis_id] = scores
 
     ranked_ids = sorted(
         ids,
@@ -381,17 +374,20 @@ def _apply_pairwise_ranking(
         reverse=True,
     )
 
+    comparisons_by_id: dict[str, list[dict[str, Any]]] = {
+        hypothesis_id: [] for hypothesis_id in ids
+    }
+    for comparison in normalized_comparisons:
+        comparisons_by_id[comparison["hypothesis_a_id"]].append(comparison)
+        comparisons_by_id[comparison["hypothesis_b_id"]].append(comparison)
+
     by_id = {item["id"]: item for item in hypotheses}
     updated: list[dict[str, Any]] = []
     for hypothesis_id in ids:
-        hypothesis = dict(by_id[hypothesis_id])
+        hypothesis = by_id[hypothesis_id]
         hypothesis["pairwise_record"] = {
-            "comparisons": [
-                cmp
-                for cmp in normalized_comparisons
-                if hypothesis_id in {cmp["hypothesis_a_id"], cmp["hypothesis_b_id"]}
-            ],
-            "wins_by_dimension": wins[hypothesis_id],
+            "comparisons": comparisons_by_id[hypothesis_id],
+            "wins_by_dimension": dict(zip(_DIMENSIONS, wins[position[hypothesis_id]])),
         }
         hypothesis["scores"] = scores_by_id[hypothesis_id]
         updated.append(hypothesis)
@@ -423,17 +419,25 @@ def _hydrate_summa_triplets(hypotheses: list[dict[str, Any]]) -> list[dict[str,
     return hydrated
 
 
+def _build_grounding_index(grounded_papers: list[SemanticScholarPaper]) -> _GroundingIndex:
+    """Internal helper to build grounding index."""
+    return _GroundingIndex(
+        valid_ids=frozenset(paper.paper_id for paper in grounded_papers if paper.paper_id),
+        valid_dois=frozenset(
+            paper.normalized_doi for paper in grounded_papers if paper.doi
+        ),
+        fallback_citations=tuple(_fallback_grounded_citations(grounded_papers)),
+    )
+
+
 def _sanitize_citations(
     citations: Any,
-    grounded_papers: list[SemanticScholarPaper],
+    grounding: _GroundingIndex,
 ) -> list[dict[str, Any]]:
     """Internal helper to sanitize citations."""
     if not isinstance(citations, list):
         return []
 
-    valid_ids = {paper.paper_id for paper in grounded_papers if paper.paper_id}
-    valid_dois = {_normalize_doi(paper.doi) for paper in grounded_papers if paper.doi}
-
     sanitized: list[dict[str, Any]] = []
     seen: set[str] = set()
     for citation in citations:
@@ -452,19 +456,22 @@ def _sanitize_citations(
         if not isinstance(year, int):
             continue
 
-        has_valid_paper_id = isinstance(paper_id, str) and paper_id.strip() in valid_ids
-        has_valid_doi = isinstance(doi, str) and _normalize_doi(doi) in valid_dois
+        normalized_doi = _normalize_doi(doi) if isinstance(doi, str) else ""
+        has_valid_paper_id = (
+            isinstance(paper_id, str) and paper_id.strip() in grounding.valid_ids
+        )
+        has_valid_doi = isinstance(doi, str) and normalized_doi in grounding.valid_dois
         if not (has_valid_paper_id or has_valid_doi):
             continue
 
-        key = paper_id.strip() if has_valid_paper_id else f"doi:{_normalize_doi(doi)}"
+        key = paper_id.strip() if has_valid_paper_id else f"doi:{normalized_doi}"
         if key in seen:
             continue
         seen.add(key)
 
         payload: dict[str, Any] = {
             "title": title.strip(),
-            "authors": [str(item).strip() for item in authors if str(item).strip()],
+            "authors": [name for item in authors if (name := str(item).strip())],
             "year": year,
         }
         if has_valid_paper_id:
@@ -496,14 +503,14 @@ def _fallback_grounded_citations(
         if not paper.paper_id and not paper.doi:
             continue
 
-        key = paper.paper_id or f"doi:{_normalize_doi(paper.doi)}"
+        key = paper.paper_id or f"doi:{paper.normalized_doi}"
         if key in seen:
             continue
         seen.add(key)
 
         citation = {
             "title": paper.title.strip(),
-            "authors": [str(author).strip() for author in paper.authors if str(author).strip()],
+            "authors": [name for author in paper.authors if (name := str(author).strip())],
             "year": int(paper.year),
         }
         if paper.paper_id:
@@ -518,91 +525,62 @@ def _fallback_grounded_citations(
 
 def _ensure_objections(raw: Any) -> list[dict[str, Any]]:
     """Internal helper to ensure objections."""
-    objections: list[dict[str, Any]] = []
-    if isinstance(raw, list):
-        for item in raw:
-            if not isinstance(item, dict):
-                continue
-            number = item.get("number")
-            text = item.get("text")
-            if isinstance(number, int) and isinstance(text, str) and text.strip():
-                objections.append({"number": number, "text": text.strip()})
-
-    objections = sorted(objections, key=lambda item: item["number"])
-    for n in [1, 2, 3]:
-        if not any(item["number"] == n for item in objections):
-            objections.append(
-                {
-                    "number": n,
-                    "text": f"Objection {n} was not explicitly provided; further critique required.",
-                }
-            )
-    objections = sorted(objections, key=lambda item: item["number"])
-    return objections[:3]
+    return _ensure_numbered_list(
+        raw,
+        number_key="number",
+        stub_text="Objection {n} was not explicitly provided; further critique required.",
+    )
 
 
 def _ensure_replies(raw: Any) -> list[dict[str, Any]]:
     """Internal helper to ensure replies."""
-    replies: list[dict[str, Any]] = []
+    return _ensure_numbered_list(
+        raw,
+        number_key="objection_number",
+        stub_text="Reply to objection {n} requires further elaboration.",
+    )
+
+
+def _ensure_numbered_list(
+    raw: Any,
+    *,
+    number_key: str,
+    stub_text: str,
+) -> list[dict[str, Any]]:
+    """Return items numbered 1-3 in order, stubbing any that are missing.
+
+    The first valid item seen for a number wins; later duplicates and numbers
+    outside 1-3 are dropped.
+    """
+    by_number: dict[int, str] = {}
     if isinstance(raw, list):
         for item in raw:
             if not isinstance(item, dict):
                 continue
-            number = item.get("objection_number")
+            number = item.get(number_key)
             text = item.get("text")
-            if isinstance(number, int) and isinstance(text, str) and text.strip():
-                replies.append({"objection_number": number, "text": text.strip()})
-
-    replies = sorted(replies, key=lambda item: item["objection_number"])
-    for n in [1, 2, 3]:
-        if not any(item["objection_number"] == n for item in replies):
-            replies.append(
-                {
-                    "objection_number": n,
-                    "text": f"Reply to objection {n} requires further elaboration.",
-                }
-            )
-    replies = sorted(replies, key=lambda item: item["objection_number"])
-    return replies[:3]
+            if (
+                isinstance(number, int)
+                and 1 <= number <= 3
+                and number not in by_number
+                and isinstance(text, str)
+                and (text := text.strip())
+            ):
+                by_number[number] = text
+
+    return [
+        {number_key: n, "text": by_number.get(n) or stub_text.format(n=n)}
+        for n in (1, 2, 3)
+    ]
 
 
 def _winner(value: Any) -> str:
     """Internal helper to winner."""
+    # Well-formed ranker output already uses the exact labels.
+    if isinstance(value, str) and value in _VALID_WINNERS:
+        return value
     text = str(value).strip().lower()
-    if text in {"a", "b", "tie"}:
-        return text
-    return "tie"
-
-
-def _accumulate_win(
-    wins: dict[str, dict[str, int]],
-    dimension: str,
-    winner: str,
-    a: str,
-    b: str,
-) -> None:
-    """Internal helper to accumulate win."""
-    if winner == "a":
-        wins[a][dimension] += 1
-    elif winner == "b":
-        wins[b][dimension] += 1
-
-
-def _accumulate_points(
-    points: dict[str, dict[str, float]],
-    dimension: str,
-    winner: str,
-    a: str,
-    b: str,
-) -> None:
-    """Internal helper to accumulate points."""
-    if winner == "a":
-        points[a][dimension] += 1.0
-    elif winner == "b":
-        points[b][dimension] += 1.0
-    else:
-        points[a][dimension] += 0.5
-        points[b][dimension] += 0.5
+    return text if text in _VALID_WINNERS else "tie"
 
 
 def _as_id(value: Any, fallback_counter: int) -> str:
@@ -614,33 +592,27 @@ def _as_id(value: Any, fallback_counter: int) -> str:
 
 def _as_nonempty_text(value: Any, fallback: str) -> str:
     """Internal helper to as nonempty text."""
-    if isinstance(value, str) and value.strip():
-        return value.strip()
+    if isinstance(value, str) and (text := value.strip()):
+        return text
     return fallback
 
 
 def _normalize_text_list(value: Any, fallback: str) -> list[str]:
     """Internal helper to normalize text list."""
     if isinstance(value, list):
-        cleaned = [str(item).strip() for item in value if str(item).strip()]
+        cleaned = [text for item in value if (text := str(item).strip())]
         if cleaned:
             return cleaned
     return [fallback]
 
 
-def _normalize_doi(value: str | None) -> str:
-    """Internal helper to normalize doi."""
-    if not value:
-        return ""
-    normalized = value.strip().lower()
-    if normalized.startswith("doi:"):
-        normalized = normalized[4:].strip()
-    return normalized
-
-
 def _as_json(value: Any) -> str:
-    """Internal helper to as json."""
-    return json.dumps(value, ensure_ascii=True)
+    """Internal helper to as json.
+
+    Non-ASCII text is emitted as UTF-8 rather than \\uXXXX escapes, which keeps
+    paper titles and author names readable and cheaper in prompt tokens.
+    """
+    return json_codec.dumps(value, ensure_ascii=False)
 
 
 def _ensure_summa_rendering(
@@ -651,7 +623,11 @@ def _ensure_summa_rendering(
     ranked_ids: list[str],
     top: int,
 ) -> str:
-    """Internal helper to ensure summa rendering."""
+    """Internal helper to ensure summa rendering.
+
+    Hypotheses must already be hydrated by _hydrate_summa_triplets, so each
+    carries objections and replies numbered 1-3.
+    """
     cleaned = raw_rendering.strip()
     target_blocks = max(1, min(top, len(ranked_ids)))
     if _is_valid_summa_rendering(cleaned, target_blocks):
@@ -669,23 +645,16 @@ def _is_valid_summa_rendering(rendering: str, expected_blocks: int) -> bool:
         return False
     blocks = blocks[:expected_blocks]
 
-    required_markers = [
-        "question:",
-        "objections:",
-        "on the contrary",
-        "i answer that",
-        "replies to objections",
-    ]
     for block in blocks:
-        lowered = block.lower()
-        if any(marker not in lowered for marker in required_markers):
+        # Case-sensitive numbering checks need no lowercased copy, so run first.
+        if not ("1." in block and "2." in block and "3." in block):
             return False
-        if not all(f"{n}." in block for n in [1, 2, 3]):
+        lowered = block.lower()
+        if not all(marker in lowered for marker in _REQUIRED_MARKERS):
             return False
         # Reject if "on the contrary" and "i answer that" are merged on the same line.
-        for line in block.splitlines():
-            line_lower = line.lower()
-            if "on the contrary" in line_lower and "i answer that" in line_lower:
+        for line in lowered.splitlines():
+            if "on the contrary" in line and "i answer that" in line:
                 return False
     return True
 
@@ -718,25 +687,23 @@ def _build_summa_rendering(
             hypothesis=hypothesis,
             competitor=by_id.get(competitor_id) if competitor_id else None,
         )
-        block_lines: list[str] = []
-        block_lines.append(f"Question: {question}")
-        block_lines.append("")
-        block_lines.append("Objections:")
-        for objection in _ensure_objections(hypothesis.get("objections")):
-            block_lines.append(f"{objection['number']}. {objection['text']}")
-        block_lines.append("")
-        block_lines.append("On the contrary...")
-        block_lines.append(on_the_contrary)
-        block_lines.append("")
-        block_lines.append("I answer that...")
-        block_lines.append(_as_nonempty_text(hypothesis.get("statement"), "No thesis stated."))
-        block_lines.append("")
-        block_lines.append("Replies to objections:")
-        for reply in _ensure_replies(hypothesis.get("replies")):
-            block_lines.append(
-                f"Reply to Objection {reply['objection_number']}. {reply['text']}"
-            )
-        blocks.append("\n".join(block_lines).strip())
+        objections_text = "\n".join(
+            f"{objection['number']}. {objection['text']}"
+            for objection in hypothesis["objections"]
+        )
+        replies_text = "\n".join(
+            f"Reply to Objection {reply['objection_number']}. {reply['text']}"
+            for reply in hypothesis["replies"]
+        )
+        statement = _as_nonempty_text(hypothesis.get("statement"), "No thesis stated.")
+        block = (
+            f"Question: {question}\n\n"
+            f"Objections:\n{objections_text}\n\n"
+            f"On the contrary...\n{on_the_contrary}\n\n"
+            f"I answer that...\n{statement}\n\n"
+            f"Replies to objections:\n{replies_text}"
+        )
+        blocks.append(block.strip())
 
     if len(blocks) == 1:
         return blocks[0]
@@ -772,11 +739,11 @@ def _compose_on_the_contrary(
         )
         return f"On the contrary, one may hold that {competitor_statement}"
 
-    strongest_objection = _ensure_objections(hypothesis.get("objections"))[0]["text"]
+    strongest_objection = hypothesis["objections"][0]["text"]
     return f"On the contrary, the strongest objection states that {strongest_objection}"
 
 
 def _split_summa_blocks(rendering: str) -> list[str]:
     """Internal helper to split summa blocks."""
-    raw_blocks = re.split(r"\n\s*---\s*\n", rendering.strip())
+    raw_blocks = _BLOCK_SEP_RE.split(rendering.strip())
     return [block.strip() for block in raw_blocks if block.strip()]
@@ -13,14 +13,21 @@ This file never decides WHAT to do — it just executes what crew_v2.py asks for
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+import functools
 import json
 from pathlib import Path
 import re
 from typing import Any, Callable
 
+from . import json_codec
 from .config import Settings
 
+# Fences around a SummaComposer reply that skipped the JSON wrapper.
+_MARKDOWN_FENCE_OPEN_RE = re.compile(r"^```(?:markdown|md)?\s*")
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+
 
 @dataclass
 class _StageFailure(Exception):
@@ -108,8 +115,8 @@ def _run_summa_composer_stage(
 
     # The agent returned raw Summa text instead of JSON. Use it directly.
     cleaned = raw.strip()
-    cleaned = re.sub(r"^```(?:markdown|md)?\s*", "", cleaned)
-    cleaned = re.sub(r"\s*```$", "", cleaned)
+    cleaned = _MARKDOWN_FENCE_OPEN_RE.sub("", cleaned)
+    cleaned = _FENCE_CLOSE_RE.sub("", cleaned)
     if not cleaned:
         raise ValueError("SummaComposer returned empty output.")
     return {"summa_rendering": cleaned}
@@ -125,14 +132,7 @@ def _run_agent_task(
     model_override: str | None = None,
 ) -> str:
     """Execute a CrewAI task and return raw text from the final stage output."""
-    try:
-        from crewai import Agent, Crew, Process, Task
-    except ModuleNotFoundError as exc:
-        if exc.name == "crewai":
-            raise RuntimeError(
-                "crewai is not installed. Run: pip install crewai && pip install -e ."
-            ) from exc
-        raise
+    Agent, Crew, Process, Task = _crewai_classes()
 
     description_template = _require_nonempty_str(task_cfg, "description")
     expected_output_template = _require_nonempty_str(task_cfg, "expected_output")
@@ -166,20 +166,39 @@ def _run_agent_task(
     return _extract_raw_output(output)
 
 
+@functools.lru_cache(maxsize=1)
+def _crewai_classes() -> tuple[Any, Any, Any, Any]:
+    """Internal helper to import the CrewAI classes once, on first stage run.
+
+    Agents are still built per stage: CrewAI binds an agent to its crew and
+    mutates it during kickoff, so instances are not safe to share.
+    """
+    try:
+        from crewai import Agent, Crew, Process, Task
+    except ModuleNotFoundError as exc:
+        if exc.name == "crewai":
+            raise RuntimeError(
+                "crewai is not installed. Run: pip install crewai && pip install -e ."
+            ) from exc
+        raise
+    return Agent, Crew, Process, Task
+
+
 def _extract_raw_output(output: Any) -> str:
     """Internal helper to extract raw output."""
-    if isinstance(output, str):
-        return output
-
+    # CrewAI's kickoff result almost always carries the text on .raw; the
+    # isspace() test rejects blank text without allocating a stripped copy.
     raw = getattr(output, "raw", None)
-    if isinstance(raw, str) and raw.strip():
+    if isinstance(raw, str) and raw and not raw.isspace():
         return raw
 
+    if isinstance(output, str):
+        return output
+
     tasks_output = getattr(output, "tasks_output", None)
     if isinstance(tasks_output, list) and tasks_output:
-        maybe_last = tasks_output[-1]
-        maybe_raw = getattr(maybe_last, "raw", None)
-        if isinstance(maybe_raw, str) and maybe_raw.strip():
+        maybe_raw = getattr(tasks_output[-1], "raw", None)
+        if isinstance(maybe_raw, str) and maybe_raw and not maybe_raw.isspace():
             return maybe_raw
 
     return str(output)
@@ -187,18 +206,16 @@ def _extract_raw_output(output: Any) -> str:
 
 def _parse_json_object(raw: str) -> dict[str, Any]:
     """Internal helper to parse json object."""
-    text = raw.strip()
-    text = re.sub(r"^```(?:json)?\s*", "", text)
-    text = re.sub(r"\s*```$", "", text)
+    text = json_codec.strip_code_fence(raw.strip())
 
     try:
-        payload = json.loads(text)
+        payload = json_codec.loads(text)
     except json.JSONDecodeError:
-        match = re.search(r"\{.*\}", text, flags=re.DOTALL)
-        if not match:
+        candidate = json_codec.find_json_object(text)
+        if candidate is None:
             snippet = raw[:260].replace("\n", " ")
             raise ValueError(f"No JSON object found in stage output: {snippet}") from None
-        payload = json.loads(match.group(0))
+        payload = json_codec.loads_lenient(candidate)
 
     if not isinstance(payload, dict):
         raise ValueError("Stage output must be a JSON object.")
@@ -206,7 +223,31 @@ def _parse_json_object(raw: str) -> dict[str, Any]:
 
 
 def _load_yaml_config(path: Path) -> dict[str, Any]:
-    """Internal helper to load yaml config."""
+    """Internal helper to load yaml config.
+
+    Parsed files are cached per resolved path, modification time and size, so
+    edits are picked up on the next run; callers get a deep copy so that
+    mutating a returned config cannot leak into later runs.
+    """
+    resolved = path.resolve()
+    stat = resolved.stat()
+    return copy.deepcopy(
+        _load_yaml_config_cached(str(resolved), stat.st_mtime_ns, stat.st_size)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_config_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Internal helper to parse a YAML config file once per version on disk."""
+    content = _yaml_safe_load()(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(content, dict):
+        raise ValueError(f"Invalid YAML object at {path}")
+    return content
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_safe_load() -> Callable[[str], Any]:
+    """Internal helper to import PyYAML once and pick its fastest safe loader."""
     try:
         import yaml
     except ModuleNotFoundError as exc:
@@ -214,22 +255,34 @@ def _load_yaml_config(path: Path) -> dict[str, Any]:
             "PyYAML is required for V2 mode. Run: pip install -e ."
         ) from exc
 
-    content = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if not isinstance(content, dict):
-        raise ValueError(f"Invalid YAML object at {path}")
-    return content
+    # Prefer the libyaml C loader when PyYAML was built with it.
+    return functools.partial(yaml.load, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
 
 def _render_template(template: str, inputs: dict[str, str]) -> str:
     """Render {key} placeholders while preserving unrelated literal braces.
 
     Using str.format() is unsafe here because task prompts include literal JSON
-    examples like {"summa_rendering": "..."} that trigger KeyError.
+    examples like {"summa_rendering": "..."} that trigger KeyError. Placeholders
+    without a matching input are left untouched, and substituted values are
+    never re-scanned, so inserted JSON cannot be mistaken for a placeholder.
     """
-    rendered = template
-    for key, value in inputs.items():
-        rendered = rendered.replace("{" + key + "}", value)
-    return rendered
+    parts = _compile_template(template)
+    rendered = list(parts)
+    # Odd indices hold placeholder names, even indices the literal text between them.
+    for index in range(1, len(parts), 2):
+        name = parts[index]
+        rendered[index] = inputs[name] if name in inputs else "{" + name + "}"
+    return "".join(rendered)
+
+
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str) -> tuple[str, ...]:
+    """Internal helper to split a template into literal and placeholder parts once."""
+    return tuple(_PLACEHOLDER_RE.split(template))
 
 
 def _require_nonempty_str(payload: dict[str, Any], key: str) -> str:
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import asdict
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import statistics
 import sys
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from .config import Settings
 from .eval_v1 import (
@@ -74,6 +73,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.0,
         help="Optional delay between cases to reduce throttling.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of benchmark cases to run concurrently (default: 1, sequential).",
+    )
     parser.add_argument(
         "--run-label",
         default=None,
@@ -108,6 +113,9 @@ def main() -> None:
     if args.skip_v1 and args.skip_v2:
         print("Error: cannot skip both v1 and v2.", file=sys.stderr)
         raise SystemExit(2)
+    if args.workers < 1:
+        print("Error: --workers must be at least 1.", file=sys.stderr)
+        raise SystemExit(2)
 
     try:
         cases = load_benchmarks(args.benchmarks)
@@ -142,12 +150,42 @@ def main() -> None:
         "domains_filter": args.domain,
         "top": args.top,
         "sleep_seconds": args.sleep_seconds,
+        "workers": args.workers,
         "model": settings.model,
         "skip_v1": args.skip_v1,
         "skip_v2": args.skip_v2,
     }
     write_json(run_dir / "manifest.json", manifest)
 
+    if args.workers == 1:
+        records = _run_cases_sequentially(args, selected, run_dir, run_v1, run_v2)
+    else:
+        records = _run_cases_concurrently(args, selected, run_dir, run_v1, run_v2)
+
+    summary = build_comparison_summary(
+        records=records,
+        manifest=manifest,
+        finished_at_utc=utc_now(),
+        model=settings.model,
+    )
+    write_json(run_dir / "summary.json", summary)
+    write_text(run_dir / "summary.md", build_summary_markdown(summary))
+    write_json(run_dir / "go_no_go.json", summary["go_no_go"])
+
+    print(
+        f"Comparison complete. Artifacts: {run_dir}\n"
+        f"Go/No-Go: {summary['go_no_go']['recommendation']}"
+    )
+
+
+def _run_cases_sequentially(
+    args: argparse.Namespace,
+    selected: list[BenchmarkCase],
+    run_dir: Path,
+    run_v1: Callable[..., Any] | None,
+    run_v2: Callable[..., Any] | None,
+) -> list[dict[str, Any]]:
+    """Internal helper to run cases one at a time, in benchmark order."""
     records: list[dict[str, Any]] = []
     for index, case in enumerate(selected, start=1):
         print(f"[{index}/{len(selected)}] {case.id} ({case.domain})")
@@ -159,33 +197,75 @@ def main() -> None:
             top=args.top,
         )
         records.append(record)
-        write_json(run_dir / f"{index:02d}_{safe_slug(case.id)}.json", record)
-
-        v1_status = record.get("v1", {}).get("status", "skipped")
-        v2_status = record.get("v2", {}).get("status", "skipped")
-        print(f"  -> v1={v1_status} | v2={v2_status}")
+        both_failed = _save_case_record(run_dir, index, case, record)
 
-        if args.fail_fast and v1_status != "ok" and v2_status != "ok":
+        if args.fail_fast and both_failed:
             print("Fail-fast triggered: both modes failed on this case.", file=sys.stderr)
             break
 
         if args.sleep_seconds > 0:
             time.sleep(args.sleep_seconds)
+    return records
 
-    summary = build_comparison_summary(
-        records=records,
-        manifest=manifest,
-        finished_at_utc=utc_now(),
-        model=settings.model,
-    )
-    write_json(run_dir / "summary.json", summary)
-    write_text(run_dir / "summary.md", build_summary_markdown(summary))
-    write_json(run_dir / "go_no_go.json", summary["go_no_go"])
 
-    print(
-        f"Comparison complete. Artifacts: {run_dir}\n"
-        f"Go/No-Go: {summary['go_no_go']['recommendation']}"
-    )
+def _run_cases_concurrently(
+    args: argparse.Namespace,
+    selected: list[BenchmarkCase],
+    run_dir: Path,
+    run_v1: Callable[..., Any] | None,
+    run_v2: Callable[..., Any] | None,
+) -> list[dict[str, Any]]:
+    """Internal helper to run cases on a thread pool, returning records in benchmark order.
+
+    Cases are I/O bound on model and retrieval calls, so threads overlap their
+    latency. --sleep-seconds staggers case starts; --fail-fast cancels cases
+    that have not started yet, while cases already running finish and are kept.
+    """
+    records_by_index: dict[int, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {}
+        for index, case in enumerate(selected, start=1):
+            if index > 1 and args.sleep_seconds > 0:
+                time.sleep(args.sleep_seconds)
+            future = executor.submit(
+                run_case_pair,
+                case=case,
+                run_v1=run_v1,
+                run_v2=run_v2,
+                objective=args.objective,
+                top=args.top,
+            )
+            futures[future] = (index, case)
+
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            index, case = futures[future]
+            print(f"[{index}/{len(selected)}] {case.id} ({case.domain})")
+            record = future.result()
+            records_by_index[index] = record
+            both_failed = _save_case_record(run_dir, index, case, record)
+
+            if args.fail_fast and both_failed:
+                print("Fail-fast triggered: both modes failed on this case.", file=sys.stderr)
+                for pending in futures:
+                    pending.cancel()
+    return [records_by_index[index] for index in sorted(records_by_index)]
+
+
+def _save_case_record(
+    run_dir: Path,
+    index: int,
+    case: BenchmarkCase,
+    record: dict[str, Any],
+) -> bool:
+    """Internal helper to persist one case record and report whether both modes failed."""
+    write_json(run_dir / f"{index:02d}_{safe_slug(case.id)}.json", record)
+
+    v1_status = record.get("v1", {}).get("status", "skipped")
+    v2_status = record.get("v2", {}).get("status", "skipped")
+    print(f"  -> v1={v1_status} | v2={v2_status}")
+    return v1_status != "ok" and v2_status != "ok"
 
 
 def run_case_pair(
@@ -198,7 +278,7 @@ def run_case_pair(
 ) -> dict[str, Any]:
     """Run case pair."""
     record: dict[str, Any] = {
-        "benchmark": asdict(case),
+        "benchmark": case.to_dict(),
     }
     if run_v1 is not None:
         record["v1"] = run_case_v1(case=case, run_v1=run_v1, objective=objective)
@@ -220,7 +300,7 @@ def run_case_v1(
 ) -> dict[str, Any]:
     """Run case v1."""
     started = utc_now()
-    t0 = time.perf_counter()
+    t0 = time.monotonic_ns()
     try:
         result = run_v1(case.question, domain=case.domain, objective=objective)
         payload = result.to_dict()
@@ -229,7 +309,7 @@ def run_case_v1(
             "status": "ok",
             "started_at_utc": started,
             "finished_at_utc": utc_now(),
-            "duration_seconds": round(time.perf_counter() - t0, 3),
+            "duration_seconds": round((time.monotonic_ns() - t0) / 1e9, 3),
             "output": payload,
             "metrics": metrics,
         }
@@ -238,7 +318,7 @@ def run_case_v1(
             "status": "error",
             "started_at_utc": started,
             "finished_at_utc": utc_now(),
-            "duration_seconds": round(time.perf_counter() - t0, 3),
+            "duration_seconds": round((time.monotonic_ns() - t0) / 1e9, 3),
             "error": {"type": type(exc).__name__, "message": str(exc)},
         }
 
@@ -252,7 +332,7 @@ def run_case_v2(
 ) -> dict[str, Any]:
     """Run case v2."""
     started = utc_now()
-    t0 = time.perf_counter()
+    t0 = time.monotonic_ns()
     try:
         payload = run_v2(case.question, domain=case.domain, objective=objective, top=top)
         metrics = evaluate_v2_metrics(case=case, payload=payload)
@@ -260,7 +340,7 @@ def run_case_v2(
             "status": "ok",
             "started_at_utc": started,
             "finished_at_utc": utc_now(),
-            "duration_seconds": round(time.perf_counter() - t0, 3),
+            "duration_seconds": round((time.monotonic_ns() - t0) / 1e9, 3),
             "output": payload,
             "metrics": metrics,
         }
@@ -269,14 +349,14 @@ def run_case_v2(
             "status": "error",
             "started_at_utc": started,
             "finished_at_utc": utc_now(),
-            "duration_seconds": round(time.perf_counter() - t0, 3),
+            "duration_seconds": round((time.monotonic_ns() - t0) / 1e9, 3),
             "error": {"type": type(exc).__name__, "message": str(exc)},
         }
 
 
 def evaluate_v1_metrics(case: BenchmarkCase, payload: dict[str, Any]) -> dict[str, Any]:
     """Evaluate v1 metrics."""
-    text_blob = json.dumps(payload, ensure_ascii=False).lower()
+    text_blob = "\n".join(_iter_string_leaves(payload))
     return {
         "summa_complete": is_summa_complete_v1(payload),
         "keyword_relevance": has_keyword_relevance(text_blob, case.relevance_keywords),
@@ -298,29 +378,43 @@ def evaluate_v2_metrics(case: BenchmarkCase, payload: dict[str, Any]) -> dict[st
     total_citations = 0
     grounded_ids_or_dois = 0
     has_falsifiable = True
-    for hypothesis in hypotheses if isinstance(hypotheses, list) else []:
-        if not isinstance(hypothesis, dict):
-            has_falsifiable = False
-            continue
-        preds = hypothesis.get("falsifiable_predictions")
-        if not isinstance(preds, list) or not preds:
-            has_falsifiable = False
-
-        citations = hypothesis.get("citations")
-        if isinstance(citations, list):
+    if schema_valid:
+        # The schema already guarantees object hypotheses with non-empty
+        # falsifiable_predictions and citation arrays of objects.
+        for hypothesis in hypotheses:
+            citations = hypothesis["citations"]
             total_citations += len(citations)
-            for citation in citations:
-                if isinstance(citation, dict):
-                    if _has_nonempty_str(citation, "paper_id") or _has_nonempty_str(citation, "doi"):
+            grounded_ids_or_dois += sum(
+                1
+                for citation in citations
+                if _has_nonempty_str(citation, "paper_id") or _has_nonempty_str(citation, "doi")
+            )
+    else:
+        for hypothesis in hypotheses if isinstance(hypotheses, list) else []:
+            if not isinstance(hypothesis, dict):
+                has_falsifiable = False
+                continue
+            preds = hypothesis.get("falsifiable_predictions")
+            if not isinstance(preds, list) or not preds:
+                has_falsifiable = False
+
+            citations = hypothesis.get("citations")
+            if isinstance(citations, list):
+                total_citations += len(citations)
+                for citation in citations:
+                    if isinstance(citation, dict) and (
+                        _has_nonempty_str(citation, "paper_id")
+                        or _has_nonempty_str(citation, "doi")
+                    ):
                         grounded_ids_or_dois += 1
-        else:
-            has_falsifiable = False
+            else:
+                has_falsifiable = False
 
     rendering = payload.get("summa_rendering", "")
     rendering_text = rendering if isinstance(rendering, str) else ""
     rendering_lower = rendering_text.lower()
     fallback_no_citations = "no grounded citations found" in rendering_lower
-    text_blob = json.dumps(payload, ensure_ascii=False).lower()
+    text_blob = "\n".join(_iter_string_leaves(payload))
 
     return {
         "schema_valid": schema_valid,
@@ -357,39 +451,61 @@ def build_comparison_summary(
     }
 
 
-def summarize_mode(records: list[dict[str, Any]], mode: str) -> dict[str, Any]:
-    """Summarize mode."""
-    entries = [item.get(mode, {}) for item in records if isinstance(item.get(mode), dict)]
-    ok_entries = [item for item in entries if item.get("status") == "ok"]
-    error_entries = [item for item in entries if item.get("status") == "error"]
-    skipped_entries = [item for item in entries if item.get("status") == "skipped"]
+# Summary rate name and per-case metric key for each mode, in output order.
+_MODE_RATE_METRICS = {
+    "v1": (
+        ("summa_complete_rate", "summa_complete"),
+        ("keyword_relevance_rate", "keyword_relevance"),
+        ("avoids_known_bad_pattern_rate", "avoids_known_bad_pattern"),
+    ),
+    "v2": (
+        ("schema_valid_rate", "schema_valid"),
+        ("summa_complete_rate", "summa_complete"),
+        ("falsifiable_predictions_rate", "falsifiable_predictions_present"),
+        ("grounded_citations_rate", "grounded_citations_present"),
+        ("keyword_relevance_rate", "keyword_relevance"),
+        ("avoids_known_bad_pattern_rate", "avoids_known_bad_pattern"),
+    ),
+}
+
 
-    durations = [float(item.get("duration_seconds", 0.0)) for item in ok_entries]
+def summarize_mode(records: list[dict[str, Any]], mode: str) -> dict[str, Any]:
+    """Summarize mode in a single pass over the case records."""
+    rate_metrics = _MODE_RATE_METRICS.get(mode, ())
+    true_counts = [0] * len(rate_metrics)
+    total = failed = skipped = 0
+    durations: list[float] = []
+    for item in records:
+        entry = item.get(mode)
+        if not isinstance(entry, dict):
+            continue
+        total += 1
+        status = entry.get("status")
+        if status == "error":
+            failed += 1
+        elif status == "skipped":
+            skipped += 1
+        elif status == "ok":
+            durations.append(float(entry.get("duration_seconds", 0.0)))
+            entry_metrics = entry.get("metrics")
+            if isinstance(entry_metrics, dict):
+                for index, (_, metric_key) in enumerate(rate_metrics):
+                    if entry_metrics.get(metric_key) is True:
+                        true_counts[index] += 1
+
+    succeeded = len(durations)
     avg_duration = round(statistics.mean(durations), 3) if durations else None
     p95_duration = round(_percentile(durations, 95), 3) if durations else None
-
-    metrics: dict[str, Any] = {}
-    if mode == "v1":
-        metrics = {
-            "summa_complete_rate": _rate(ok_entries, "summa_complete"),
-            "keyword_relevance_rate": _rate(ok_entries, "keyword_relevance"),
-            "avoids_known_bad_pattern_rate": _rate(ok_entries, "avoids_known_bad_pattern"),
-        }
-    elif mode == "v2":
-        metrics = {
-            "schema_valid_rate": _rate(ok_entries, "schema_valid"),
-            "summa_complete_rate": _rate(ok_entries, "summa_complete"),
-            "falsifiable_predictions_rate": _rate(ok_entries, "falsifiable_predictions_present"),
-            "grounded_citations_rate": _rate(ok_entries, "grounded_citations_present"),
-            "keyword_relevance_rate": _rate(ok_entries, "keyword_relevance"),
-            "avoids_known_bad_pattern_rate": _rate(ok_entries, "avoids_known_bad_pattern"),
-        }
+    metrics = {
+        rate_name: round(true_count / succeeded, 3) if succeeded else None
+        for (rate_name, _), true_count in zip(rate_metrics, true_counts)
+    }
 
     return {
-        "total": len(entries),
-        "succeeded": len(ok_entries),
-        "failed": len(error_entries),
-        "skipped": len(skipped_entries),
+        "total": total,
+        "succeeded": succeeded,
+        "failed": failed,
+        "skipped": skipped,
         "average_duration_seconds": avg_duration,
         "p95_duration_seconds": p95_duration,
         "metrics": metrics,
@@ -481,6 +597,15 @@ def build_summary_markdown(summary: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+_SUMMA_MARKERS = (
+    "question:",
+    "objections:",
+    "on the contrary",
+    "i answer that",
+    "replies to objections",
+)
+
+
 def is_summa_complete_v1(payload: dict[str, Any]) -> bool:
     """Return whether summa complete v1."""
     objections = payload.get("objections")
@@ -500,28 +625,33 @@ def is_summa_complete_text(text: str) -> bool:
     """Return whether summa complete text."""
     if not isinstance(text, str) or not text.strip():
         return False
-    lowered = text.lower()
-    required = [
-        "question:",
-        "objections:",
-        "on the contrary",
-        "i answer that",
-        "replies to objections",
-    ]
-    if any(marker not in lowered for marker in required):
+    # Case-sensitive numbering checks need no lowercased copy, so run first.
+    if not ("1." in text and "2." in text and "3." in text):
         return False
-    return all(f"{n}." in text for n in [1, 2, 3])
+    lowered = text.lower()
+    return all(marker in lowered for marker in _SUMMA_MARKERS)
+
 
+def has_keyword_relevance(lowered_blob: str, keywords: list[str]) -> bool:
+    """Has keyword relevance; lowered_blob must already be lowercase."""
+    return any(keyword.lower() in lowered_blob for keyword in keywords)
 
-def has_keyword_relevance(text_blob: str, keywords: list[str]) -> bool:
-    """Has keyword relevance."""
-    lowered = text_blob.lower()
-    return any(keyword.lower() in lowered for keyword in keywords)
 
+def avoids_bad_pattern(lowered_blob: str, bad_pattern: str) -> bool:
+    """Avoids bad pattern; lowered_blob must already be lowercase."""
+    return bad_pattern.lower() not in lowered_blob
 
-def avoids_bad_pattern(text_blob: str, bad_pattern: str) -> bool:
-    """Avoids bad pattern."""
-    return bad_pattern.lower() not in text_blob.lower()
+
+def _iter_string_leaves(value: Any) -> Iterator[str]:
+    """Internal helper to yield every string value nested in a payload, lowercased."""
+    if isinstance(value, str):
+        yield value.lower()
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_string_leaves(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_string_leaves(item)
 
 
 def _has_nonempty_str(payload: dict[str, Any], key: str) -> bool:
@@ -530,18 +660,6 @@ def _has_nonempty_str(payload: dict[str, Any], key: str) -> bool:
     return isinstance(value, str) and bool(value.strip())
 
 
-def _rate(entries: list[dict[str, Any]], metric_key: str) -> float | None:
-    """Internal helper to rate."""
-    if not entries:
-        return None
-    true_count = 0
-    for item in entries:
-        metrics = item.get("metrics")
-        if isinstance(metrics, dict) and metrics.get(metric_key) is True:
-            true_count += 1
-    return round(true_count / len(entries), 3)
-
-
 def _threshold(value: float | None, threshold: float) -> bool | None:
     """Internal helper to threshold."""
     if value is None:
@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
-import json
 from pathlib import Path
 import re
 import sys
 import time
 from typing import Any, Callable
 
+from . import json_codec
 from .config import Settings
 
 
 REQUIRED_DOMAINS = ("physics", "mathematics", "biology", "computer_science")
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+# Case records are appended to one JSONL file; flush it every this many cases.
+_CASES_FLUSH_EVERY = 16
 
 
 @dataclass(frozen=True)
@@ -26,6 +29,16 @@ class BenchmarkCase:
     relevance_keywords: list[str]
     known_bad_pattern: str
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return a plain dict copy without asdict's recursive deepcopy."""
+        return {
+            "id": self.id,
+            "domain": self.domain,
+            "question": self.question,
+            "relevance_keywords": list(self.relevance_keywords),
+            "known_bad_pattern": self.known_bad_pattern,
+        }
+
 
 def build_parser() -> argparse.ArgumentParser:
     """Build parser."""
@@ -73,6 +86,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Stop at first failure.",
     )
+    parser.add_argument(
+        "--per-case-files",
+        action="store_true",
+        help="Also write one JSON file per case next to cases.jsonl.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -131,25 +149,32 @@ def main() -> None:
     records: list[dict[str, Any]] = []
     failures = 0
 
-    for index, case in enumerate(selected, start=1):
-        print(f"[{index}/{len(selected)}] Running {case.id} ({case.domain})")
-        record = run_case(case=case, run_summa=run_summa, objective=args.objective)
-        records.append(record)
-
-        case_file = run_dir / f"{index:02d}_{safe_slug(case.id)}.json"
-        write_json(case_file, record)
-
-        if record["status"] == "error":
-            failures += 1
-            print(f"  -> failed: {record['error']['message']}", file=sys.stderr)
-            if args.fail_fast:
-                print("Fail-fast enabled; stopping early.", file=sys.stderr)
-                break
-        else:
-            print(f"  -> ok ({record['duration_seconds']}s)")
-
-        if args.sleep_seconds > 0:
-            time.sleep(args.sleep_seconds)
+    with (run_dir / "cases.jsonl").open(
+        "w", encoding="utf-8", buffering=1 << 20
+    ) as cases_file:
+        for index, case in enumerate(selected, start=1):
+            print(f"[{index}/{len(selected)}] Running {case.id} ({case.domain})")
+            record = run_case(case=case, run_summa=run_summa, objective=args.objective)
+            records.append(record)
+
+            cases_file.write(json_codec.dumps(record) + "\n")
+            if index % _CASES_FLUSH_EVERY == 0:
+                cases_file.flush()
+            if args.per_case_files:
+                case_file = run_dir / f"{index:02d}_{safe_slug(case.id)}.json"
+                write_json(case_file, record)
+
+            if record["status"] == "error":
+                failures += 1
+                print(f"  -> failed: {record['error']['message']}", file=sys.stderr)
+                if args.fail_fast:
+                    print("Fail-fast enabled; stopping early.", file=sys.stderr)
+                    break
+            else:
+                print(f"  -> ok ({record['duration_seconds']}s)")
+
+            if args.sleep_seconds > 0:
+                time.sleep(args.sleep_seconds)
 
     summary = build_summary(
         records=records,
@@ -179,7 +204,11 @@ def load_benchmarks(path: Path) -> list[BenchmarkCase]:
     if not path.exists():
         raise FileNotFoundError(f"Benchmark file not found: {path}")
 
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    # Prefer the libyaml C loader when PyYAML was built with it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # Hand the loader bytes so libyaml decodes UTF-8 itself.
+    with path.open("rb") as handle:
+        raw = yaml.load(handle, Loader=loader)
     if not isinstance(raw, list):
         raise ValueError("Benchmark YAML must be a list of benchmark items.")
 
@@ -240,25 +269,25 @@ def run_case(
 ) -> dict[str, Any]:
     """Run case."""
     started_at = utc_now()
-    t0 = time.perf_counter()
+    t0 = time.monotonic_ns()
 
     try:
         result = run_summa(case.question, domain=case.domain, objective=objective)
         payload = {
             "status": "ok",
-            "benchmark": asdict(case),
+            "benchmark": case.to_dict(),
             "started_at_utc": started_at,
             "finished_at_utc": utc_now(),
-            "duration_seconds": round(time.perf_counter() - t0, 3),
+            "duration_seconds": round((time.monotonic_ns() - t0) / 1e9, 3),
             "output": result.to_dict(),
         }
     except Exception as exc:
         payload = {
             "status": "error",
-            "benchmark": asdict(case),
+            "benchmark": case.to_dict(),
             "started_at_utc": started_at,
             "finished_at_utc": utc_now(),
-            "duration_seconds": round(time.perf_counter() - t0, 3),
+            "duration_seconds": round((time.monotonic_ns() - t0) / 1e9, 3),
             "error": {
                 "type": type(exc).__name__,
                 "message": str(exc),
@@ -317,13 +346,12 @@ def build_summary_markdown(summary: dict[str, Any]) -> str:
     lines.append("")
     lines.append("| ID | Domain | Status | Duration (s) | Error |")
     lines.append("| --- | --- | --- | ---: | --- |")
-
-    for item in summary["cases"]:
-        error_text = item["error"]["message"] if item["error"] else ""
-        lines.append(
-            f"| {item['id']} | {item['domain']} | {item['status']} | "
-            f"{item['duration_seconds']} | {error_text} |"
-        )
+    lines.extend(
+        f"| {item['id']} | {item['domain']} | {item['status']} | "
+        f"{item['duration_seconds']} | "
+        f"{item['error']['message'] if item['error'] else ''} |"
+        for item in summary["cases"]
+    )
 
     return "\n".join(lines) + "\n"
 
@@ -346,7 +374,7 @@ def safe_slug(value: str | None) -> str:
     """Safe slug."""
     if not value:
         return ""
-    slug = re.sub(r"[^a-zA-Z0-9._-]+", "_", value.strip())
+    slug = _SLUG_RE.sub("_", value.strip())
     return slug.strip("._-")
 
 
@@ -393,7 +421,9 @@ def validate_domain_coverage(cases: list[BenchmarkCase]) -> None:
 
 def write_json(path: Path, payload: dict[str, Any]) -> None:
     """Write json."""
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+        json_codec.dump(payload, handle, indent=True)
+        handle.write("\n")
 
 
 def write_text(path: Path, text: str) -> None:
@@ -2,50 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
 
 
 def to_markdown_v2(payload: dict[str, Any]) -> str:
     """To markdown v2."""
-    lines: list[str] = []
-    lines.append(f"Question: {payload.get('question', '')}")
-    lines.append(f"Domain: {payload.get('domain', '')}")
-    lines.append("")
+    return "".join(iter_markdown_v2(payload))
+
+
+def iter_markdown_v2(payload: dict[str, Any]) -> Iterator[str]:
+    """Yield the V2 markdown rendering line by line, each chunk ending in a newline."""
+    for line in _iter_lines(payload):
+        yield line + "\n"
+
+
+def _iter_lines(payload: dict[str, Any]) -> Iterator[str]:
+    """Internal helper to iter lines."""
+    yield f"Question: {payload.get('question', '')}"
+    yield f"Domain: {payload.get('domain', '')}"
+    yield ""
 
     hypotheses = payload.get("hypotheses", [])
     ranked = payload.get("ranked_hypothesis_ids", [])
-    if isinstance(hypotheses, list) and isinstance(ranked, list):
-        by_id = {
-            item.get("id"): item
+    if isinstance(hypotheses, list) and isinstance(ranked, list) and ranked:
+        # Resolve (title, overall) once per hypothesis so the loop only formats.
+        summary_by_id = {
+            item["id"]: (item.get("title", ""), _overall_score(item))
             for item in hypotheses
             if isinstance(item, dict) and isinstance(item.get("id"), str)
         }
-        if ranked:
-            lines.append("Ranked hypotheses:")
-            for idx, hypothesis_id in enumerate(ranked, start=1):
-                hypothesis = by_id.get(hypothesis_id, {})
-                title = hypothesis.get("title", "")
-                scores = hypothesis.get("scores", {}) if isinstance(hypothesis, dict) else {}
-                overall = scores.get("overall") if isinstance(scores, dict) else None
-                lines.append(f"{idx}. {hypothesis_id} - {title} (overall={overall})")
-            lines.append("")
+        yield "Ranked hypotheses:"
+        for idx, hypothesis_id in enumerate(ranked, start=1):
+            title, overall = summary_by_id.get(hypothesis_id, ("", None))
+            yield f"{idx}. {hypothesis_id} - {title} (overall={overall})"
+        yield ""
 
     summa_rendering = payload.get("summa_rendering")
     if isinstance(summa_rendering, str) and summa_rendering.strip():
-        lines.append(summa_rendering.strip())
+        yield summa_rendering.strip()
     else:
-        lines.append("No Summa rendering produced.")
+        yield "No Summa rendering produced."
 
     error_payload = payload.get("error")
     if isinstance(error_payload, dict):
-        lines.append("")
-        lines.append("Pipeline error:")
+        yield ""
+        yield "Pipeline error:"
         stage = error_payload.get("stage", "unknown")
         message = error_payload.get("message", "")
         retry = error_payload.get("retry_attempted")
-        lines.append(f"- stage: {stage}")
-        lines.append(f"- message: {message}")
-        lines.append(f"- retry_attempted: {retry}")
+        yield f"- stage: {stage}"
+        yield f"- message: {message}"
+        yield f"- retry_attempted: {retry}"
 
-    return "\n".join(lines).strip() + "\n"
 
+def _overall_score(hypothesis: dict[str, Any]) -> Any:
+    """Internal helper to read scores.overall, or None when scores is malformed."""
+    scores = hypothesis.get("scores", {})
+    return scores.get("overall") if isinstance(scores, dict) else None
@@ -0,0 +1,141 @@
+"""JSON helpers with an optional orjson fast path.
+
+orjson is used when it is installed (pip install -e ".[fast]"); otherwise the
+stdlib json module is used. Both paths emit and accept equivalent JSON, so
+callers never need to care which codec ran. This module also holds the small
+scanners used to pull a JSON object out of free-form model output, and an
+optional json5 second chance (pip install -e ".[lenient]") for near-JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import IO, Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import json5
+except ModuleNotFoundError:  # pragma: no cover - json5 is an optional fallback
+    json5 = None
+
+
+def dumps(value: Any, *, indent: bool = False, ensure_ascii: bool = True) -> str:
+    """Serialize value to JSON text, compact unless indent is requested."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches json's coercion of int/bool/None dict keys.
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            text = orjson.dumps(value, option=option).decode("utf-8")
+        except TypeError:
+            # orjson is stricter than json for a few inputs (e.g. >64-bit
+            # ints); use the stdlib below.
+            pass
+        else:
+            # orjson always emits UTF-8, so only ASCII-only output can be reused
+            # as-is when the caller asked for escaped non-ASCII characters.
+            if not ensure_ascii or text.isascii():
+                return text
+
+    if indent:
+        return json.dumps(value, indent=2, ensure_ascii=ensure_ascii)
+    return json.dumps(value, ensure_ascii=ensure_ascii, separators=(",", ":"))
+
+
+def dump(value: Any, fp: IO[str], *, indent: bool = False, ensure_ascii: bool = True) -> None:
+    """Serialize value as JSON into a text file object.
+
+    The stdlib path streams encoder chunks into fp instead of building the whole
+    document first; orjson encodes in one C call, so its text is written at once.
+    """
+    if orjson is not None:
+        fp.write(dumps(value, indent=indent, ensure_ascii=ensure_ascii))
+    elif indent:
+        json.dump(value, fp, indent=2, ensure_ascii=ensure_ascii)
+    else:
+        json.dump(value, fp, ensure_ascii=ensure_ascii, separators=(",", ":"))
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse JSON text, raising json.JSONDecodeError on invalid input."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few inputs json accepts (NaN, >64-bit ints), so
+            # let the stdlib decide and raise its own error if truly invalid.
+            pass
+    return json.loads(text)
+
+
+def loads_lenient(text: str) -> Any:
+    """Parse JSON, retrying with json5 for near-JSON when it is installed.
+
+    Model output often has trailing commas, single quotes or comments; the slow
+    json5 parse only runs after the strict parse fails, and is far cheaper than
+    re-running the stage. Raises the strict parser's json.JSONDecodeError when
+    both fail.
+    """
+    try:
+        return loads(text)
+    except json.JSONDecodeError as exc:
+        if json5 is None:
+            raise
+        try:
+            return json5.loads(text)
+        except ValueError:
+            raise exc from None
+
+
+def strip_code_fence(text: str, tag: str = "json") -> str:
+    """Remove a surrounding ```tag ... ``` markdown fence, if present."""
+    if text.startswith("```"):
+        text = text[3:]
+        if text.startswith(tag):
+            text = text[len(tag) :]
+        text = text.lstrip()
+    if text.endswith("```"):
+        text = text[:-3].rstrip()
+    return text
+
+
+# Only braces, quotes and backslashes affect object boundaries.
+_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+
+
+def find_json_object(text: str) -> str | None:
+    """Return the balanced {...} span starting at the first brace, or None.
+
+    Braces inside JSON strings are ignored, so the scan is a single linear pass
+    with no regex backtracking.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped_pos = -1
+    for match in _STRUCTURAL_RE.finditer(text, start):
+        pos = match.start()
+        if pos == escaped_pos:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_pos = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : pos + 1]
+    return None
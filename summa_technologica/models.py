@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import json
-import re
 from typing import Any
 
+from . import json_codec
+
 
 @dataclass(frozen=True)
 class Objection:
@@ -45,7 +46,7 @@ class SummaResponse:
 
     def to_json(self) -> str:
         """To json."""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=True)
+        return json_codec.dumps(self.to_dict(), indent=True)
 
 
 def parse_summa_json(raw: str) -> SummaResponse:
@@ -100,17 +101,22 @@ def parse_summa_json(raw: str) -> SummaResponse:
 def _extract_json(raw: str) -> dict[str, Any]:
     """Internal helper to extract json."""
     text = raw.strip()
-    text = re.sub(r"^```(?:json)?\s*", "", text)
-    text = re.sub(r"\s*```$", "", text)
 
+    # Most outputs are bare JSON; a fenced one fails on its first character.
     try:
-        data = json.loads(text)
+        data = json_codec.loads(text)
     except json.JSONDecodeError:
-        match = re.search(r"\{.*\}", text, flags=re.DOTALL)
-        if not match:
-            snippet = raw[:280].replace("\n", " ")
-            raise ValueError(f"No JSON object found in model output: {snippet}") from None
-        data = json.loads(match.group(0))
+        text = json_codec.strip_code_fence(text)
+        try:
+            data = json_codec.loads(text)
+        except json.JSONDecodeError:
+            candidate = json_codec.find_json_object(text)
+            if candidate is None:
+                snippet = raw[:280].replace("\n", " ")
+                raise ValueError(
+                    f"No JSON object found in model output: {snippet}"
+                ) from None
+            data = json_codec.loads(candidate)
 
     if not isinstance(data, dict):
         raise ValueError("Top-level JSON must be an object.")
@@ -120,9 +126,9 @@ def _extract_json(raw: str) -> dict[str, Any]:
 def _require_str(payload: dict[str, Any], key: str) -> str:
     """Internal helper to require str."""
     value = payload.get(key)
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, str) or not (stripped := value.strip()):
         raise ValueError(f"Field '{key}' must be a non-empty string.")
-    return value.strip()
+    return stripped
 
 
 def _require_int(payload: dict[str, Any], key: str) -> int:
@@ -13,7 +13,9 @@ reference. If a hypothesis cites a paper not in this list, it gets rejected.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import functools
 import json
 from typing import Any
 from urllib.error import HTTPError, URLError
@@ -37,6 +39,12 @@ class SemanticScholarPaper:
     doi: str | None
     url: str | None
     source_query: str
+    # Computed once so citation checks and dedupe do not re-normalize the DOI.
+    normalized_doi: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the normalized DOI for lookups."""
+        object.__setattr__(self, "normalized_doi", _normalize_doi(self.doi))
 
     def to_citation_dict(self) -> dict[str, Any]:
         """To citation dict."""
@@ -178,8 +186,15 @@ def retrieve_grounded_papers(
     api_key: str | None = None,
     per_query_limit: int = 10,
     timeout_seconds: float = 20.0,
+    prefetched: dict[str, list[SemanticScholarPaper]] | None = None,
+    max_workers: int = 4,
 ) -> RetrievalResult:
-    """Retrieve, deduplicate, and quality-rank papers for grounding."""
+    """Retrieve, deduplicate, and quality-rank papers for grounding.
+
+    Queries present in prefetched (query -> papers already fetched, e.g. in the
+    background while an earlier stage ran) are reused instead of re-requested.
+    The remaining queries are issued concurrently, up to max_workers at a time.
+    """
     queries = build_expanded_queries(
         question,
         refined_query,
@@ -198,20 +213,30 @@ def retrieve_grounded_papers(
     merged: dict[str, SemanticScholarPaper] = {}
     errors: list[str] = []
 
-    for query in queries:
-        try:
-            papers = search_semantic_scholar(
-                query,
+    prefetched = prefetched or {}
+    pending = [query for query in queries if query not in prefetched]
+    fetched = dict(
+        zip(
+            pending,
+            _search_concurrently(
+                pending,
                 base_url=base_url,
                 api_key=api_key,
                 limit=per_query_limit,
                 timeout_seconds=timeout_seconds,
-            )
-        except Exception as exc:  # pragma: no cover - covered via unit tests with mocks
-            errors.append(str(exc))
+                max_workers=max_workers,
+            ),
+        )
+    )
+
+    # Merge in query order so dedupe winners do not depend on response timing.
+    for query in queries:
+        outcome = prefetched[query] if query in prefetched else fetched[query]
+        if isinstance(outcome, Exception):
+            errors.append(str(outcome))
             continue
 
-        for paper in papers:
+        for paper in outcome:
             dedupe_key = _dedupe_key(paper)
             if dedupe_key not in merged:
                 merged[dedupe_key] = paper
@@ -247,7 +272,7 @@ def validate_citations_against_papers(
 ) -> list[str]:
     """Validate citations against papers."""
     valid_ids = {paper.paper_id for paper in papers if paper.paper_id}
-    valid_dois = {_normalize_doi(paper.doi) for paper in papers if paper.doi}
+    valid_dois = {paper.normalized_doi for paper in papers if paper.doi}
     issues: list[str] = []
 
     for idx, citation in enumerate(citations, start=1):
@@ -282,6 +307,36 @@ def validate_citations_against_papers(
     return issues
 
 
+def _search_concurrently(
+    queries: list[str],
+    *,
+    base_url: str,
+    api_key: str | None,
+    limit: int,
+    timeout_seconds: float,
+    max_workers: int,
+) -> list[list[SemanticScholarPaper] | Exception]:
+    """Internal helper to run searches in parallel, returning results or errors in query order."""
+
+    def search_one(query: str) -> list[SemanticScholarPaper] | Exception:
+        """Internal helper to search one query and capture its failure."""
+        try:
+            return search_semantic_scholar(
+                query,
+                base_url=base_url,
+                api_key=api_key,
+                limit=limit,
+                timeout_seconds=timeout_seconds,
+            )
+        except Exception as exc:  # pragma: no cover - covered via unit tests with mocks
+            return exc
+
+    if len(queries) <= 1 or max_workers <= 1:
+        return [search_one(query) for query in queries]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+        return list(executor.map(search_one, queries))
+
+
 def _build_headers(api_key: str | None) -> dict[str, str]:
     """Internal helper to build headers."""
     headers = {"Accept": "application/json"}
@@ -301,13 +356,17 @@ def _parse_paper(payload: dict[str, Any], source_query: str) -> SemanticScholarP
         return None
 
     authors = payload.get("authors")
-    author_names: list[str] = []
-    if isinstance(authors, list):
-        for author in authors:
-            if isinstance(author, dict):
-                name = author.get("name")
-                if isinstance(name, str) and name.strip():
-                    author_names.append(name.strip())
+    author_names = (
+        [
+            stripped
+            for author in authors
+            if isinstance(author, dict)
+            and isinstance(name := author.get("name"), str)
+            and (stripped := name.strip())
+        ]
+        if isinstance(authors, list)
+        else []
+    )
     if not author_names:
         return None
 
@@ -341,14 +400,23 @@ def _dedupe_key(paper: SemanticScholarPaper) -> str:
     if paper.paper_id:
         return f"paper_id:{paper.paper_id}"
     if paper.doi:
-        return f"doi:{_normalize_doi(paper.doi)}"
+        return f"doi:{paper.normalized_doi}"
     return f"title_year:{paper.title.lower()}::{paper.year}"
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_doi(value: str | None) -> str:
     """Normalize DOI strings so equivalent DOI formats compare equal."""
     if not value:
         return ""
+    # Fast path: most DOIs are already lowercase, trimmed and unprefixed.
+    if (
+        value.islower()
+        and not value[0].isspace()
+        and not value[-1].isspace()
+        and not value.startswith("doi:")
+    ):
+        return value
     normalized = value.strip().lower()
     if normalized.startswith("doi:"):
         normalized = normalized[4:].strip()
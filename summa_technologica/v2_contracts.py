@@ -16,11 +16,12 @@ returns a partial-failure payload with diagnostic info.
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import json
 from pathlib import Path
-import re
 from typing import Any
 
+from . import json_codec
 from .semantic_scholar import (
     SemanticScholarPaper,
     validate_citations_against_papers,
@@ -31,7 +32,7 @@ class ContractValidationError(ValueError):
     """Raised when a V2 payload violates schema or contract rules."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineErrorContract:
     stage: str
     message: str
@@ -95,8 +96,8 @@ def validate_v2_payload(
     if not isinstance(payload, dict):
         raise ContractValidationError("V2 payload must be a JSON object.")
 
-    schema = load_v2_schema(schema_path)
-    _validate_against_jsonschema(payload, schema)
+    schema_file = resolve_v2_schema_path(schema_path).resolve()
+    _validate_against_jsonschema(payload, _schema_validator(str(schema_file)))
     _validate_hypothesis_ids(payload)
     _validate_hypothesis_triplets(payload)
     _validate_pairwise_references(payload)
@@ -163,8 +164,10 @@ def build_partial_failure_payload(
     return validate_partial_failure_payload(payload)
 
 
-def _validate_against_jsonschema(payload: dict[str, Any], schema: dict[str, Any]) -> None:
-    """Internal helper to validate against jsonschema."""
+@functools.lru_cache(maxsize=4)
+def _schema_validator(schema_file: str) -> Any:
+    """Internal helper to build the schema validator once per schema file."""
+    schema = load_v2_schema(Path(schema_file))
     try:
         from jsonschema import Draft202012Validator
     except ModuleNotFoundError as exc:
@@ -172,7 +175,11 @@ def _validate_against_jsonschema(payload: dict[str, Any], schema: dict[str, Any]
             "jsonschema is required for V2 contract validation. Install with: pip install -e ."
         ) from exc
 
-    validator = Draft202012Validator(schema)
+    return Draft202012Validator(schema)
+
+
+def _validate_against_jsonschema(payload: dict[str, Any], validator: Any) -> None:
+    """Internal helper to validate against jsonschema."""
     errors = sorted(validator.iter_errors(payload), key=lambda err: list(err.path))
     if not errors:
         return
@@ -272,20 +279,18 @@ def _validate_citation_grounding(
 
 def _extract_json_object(raw: str) -> dict[str, Any]:
     """Internal helper to extract json object."""
-    text = raw.strip()
-    text = re.sub(r"^```(?:json)?\s*", "", text)
-    text = re.sub(r"\s*```$", "", text)
+    text = json_codec.strip_code_fence(raw.strip())
 
     try:
-        data = json.loads(text)
+        data = json_codec.loads(text)
     except json.JSONDecodeError:
-        match = re.search(r"\{.*\}", text, flags=re.DOTALL)
-        if not match:
+        candidate = json_codec.find_json_object(text)
+        if candidate is None:
             snippet = raw[:220].replace("\n", " ")
             raise ContractValidationError(
                 f"No JSON object found in model output: {snippet}"
             ) from None
-        data = json.loads(match.group(0))
+        data = json_codec.loads(candidate)
 
     if not isinstance(data, dict):
         raise ContractValidationError("Top-level JSON payload must be an object.")
@@ -0,0 +1,39 @@
+"""Unit tests for the test config module behavior."""
+
+import os
+import unittest
+from unittest.mock import patch
+
+from summa_technologica.config import Settings
+
+
+class SettingsCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        """Start every test from a cold settings cache."""
+        Settings.reset_cache()
+        self.addCleanup(Settings.reset_cache)
+
+    def test_from_env_returns_shared_instance(self) -> None:
+        """Verify that from env returns shared instance."""
+        self.assertIs(Settings.from_env(), Settings.from_env())
+
+    def test_reset_cache_rereads_environment(self) -> None:
+        """Verify that reset cache rereads environment."""
+        with patch.dict(os.environ, {"SUMMA_MODEL": "model-a"}):
+            self.assertEqual(Settings.from_env().model, "model-a")
+        with patch.dict(os.environ, {"SUMMA_MODEL": "model-b"}):
+            self.assertEqual(Settings.from_env().model, "model-a")
+            Settings.reset_cache()
+            self.assertEqual(Settings.from_env().model, "model-b")
+
+    def test_model_precedence_skips_empty_values(self) -> None:
+        """Verify that model precedence skips empty values."""
+        with patch.dict(
+            os.environ,
+            {"SUMMA_MODEL": "", "MODEL": "", "OPENAI_MODEL_NAME": "model-c"},
+        ):
+            self.assertEqual(Settings.from_env().model, "model-c")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,25 @@
 """Unit tests for the test crew v2 helpers module behavior."""
 
+import os
+from pathlib import Path
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from summa_technologica.crew_v2 import (
+    CONFIG_DIR,
     _apply_pairwise_ranking,
     _check_novelty_diversity,
+    _ensure_diversity,
     _ensure_summa_rendering,
     _hydrate_summa_triplets,
+    _load_yaml_config,
     _normalize_generated_hypotheses,
     _render_template,
     _validate_prediction_specificity,
+    run_summa_v2_batch,
 )
+from summa_technologica.crew_v2_postprocess import _ensure_objections
 from summa_technologica.semantic_scholar import SemanticScholarPaper
 
 
@@ -25,6 +34,14 @@ class CrewV2HelperTests(unittest.TestCase):
         self.assertIn("Question: Q?", rendered)
         self.assertIn("{\"summa_rendering\": \"...\"}", rendered)
 
+    def test_render_template_does_not_rescan_substituted_values(self) -> None:
+        """Verify that render template does not rescan substituted values."""
+        rendered = _render_template(
+            "A={a} B={b} C={missing}",
+            {"a": "{b}", "b": "beta"},
+        )
+        self.assertEqual(rendered, "A={b} B=beta C={missing}")
+
     def test_apply_pairwise_ranking(self) -> None:
         """Verify that apply pairwise ranking."""
         hypotheses = [
@@ -266,6 +283,29 @@ class CrewV2HelperTests(unittest.TestCase):
         )
         self.assertEqual(issues, [])
 
+    def test_ensure_diversity_prefers_sufficient_fallback_over_regeneration(self) -> None:
+        """Verify that ensure diversity prefers sufficient fallback over regeneration."""
+        pre_critic = [
+            {"id": f"h{n}", "mechanism_cause": f"cause {n}"} for n in (1, 2, 3)
+        ]
+        post_critic = pre_critic[:2]
+        durations: dict[str, float] = {}
+
+        def fail_regenerate() -> list[dict]:
+            """Fail the test if regeneration is attempted."""
+            raise AssertionError("regenerate should not be called")
+
+        hypotheses, issues = _ensure_diversity(
+            post_critic,
+            fallback=pre_critic,
+            regenerate=fail_regenerate,
+            stage_durations=durations,
+            duration_key="retry",
+        )
+        self.assertIs(hypotheses, pre_critic)
+        self.assertEqual(issues, [])
+        self.assertEqual(durations, {})
+
     def test_validate_prediction_specificity_flags_vague_predictions(self) -> None:
         """Verify specificity check separates vague and specific predictions."""
         report = _validate_prediction_specificity(
@@ -338,6 +378,69 @@ class CrewV2HelperTests(unittest.TestCase):
             [1, 2, 3],
         )
 
+    def test_ensure_objections_keeps_first_duplicate_and_fills_gaps(self) -> None:
+        """Verify that ensure objections keeps first duplicate and fills gaps."""
+        objections = _ensure_objections(
+            [
+                {"number": 2, "text": " second "},
+                {"number": 2, "text": "duplicate"},
+                {"number": 1, "text": "first"},
+                {"number": "3", "text": "not an int"},
+            ]
+        )
+        self.assertEqual([item["number"] for item in objections], [1, 2, 3])
+        self.assertEqual(objections[1]["text"], "second")
+        self.assertIn("Objection 3", objections[2]["text"])
+
+    def test_ensure_objections_drops_numbers_outside_schema(self) -> None:
+        """Verify that ensure objections drops numbers outside schema."""
+        objections = _ensure_objections(
+            [{"number": 0, "text": "zero"}, {"number": 4, "text": "four"}]
+        )
+        self.assertEqual([item["number"] for item in objections], [1, 2, 3])
+        self.assertIn("Objection 1", objections[0]["text"])
+
+    def test_load_yaml_config_returns_independent_copies(self) -> None:
+        """Verify that load yaml config returns independent copies."""
+        first = _load_yaml_config(CONFIG_DIR / "agents_v2.yaml")
+        first["critic"]["role"] = "mutated"
+        second = _load_yaml_config(CONFIG_DIR / "agents_v2.yaml")
+        self.assertNotEqual(second["critic"]["role"], "mutated")
+
+    def test_load_yaml_config_reloads_after_file_change(self) -> None:
+        """Verify that load yaml config reloads after file change."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "agents.yaml"
+            path.write_text("critic:\n  role: first\n", encoding="utf-8")
+            self.assertEqual(_load_yaml_config(path)["critic"]["role"], "first")
+
+            path.write_text("critic:\n  role: second\n", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(_load_yaml_config(path)["critic"]["role"], "second")
+
+    def test_load_yaml_config_reloads_on_size_change_with_same_mtime(self) -> None:
+        """Verify that load yaml config reloads on size change with same mtime."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "agents.yaml"
+            path.write_text("critic:\n  role: first\n", encoding="utf-8")
+            stat = path.stat()
+            self.assertEqual(_load_yaml_config(path)["critic"]["role"], "first")
+
+            path.write_text("critic:\n  role: rewritten\n", encoding="utf-8")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(_load_yaml_config(path)["critic"]["role"], "rewritten")
+
+    def test_run_summa_v2_batch_preserves_question_order(self) -> None:
+        """Verify that run summa v2 batch preserves question order."""
+        with patch(
+            "summa_technologica.crew_v2.run_summa_v2",
+            side_effect=lambda question, **kwargs: {"question": question, "top": kwargs["top"]},
+        ):
+            results = run_summa_v2_batch(["q1", "q2", "q3"], top=3, max_workers=2)
+        self.assertEqual([item["question"] for item in results], ["q1", "q2", "q3"])
+        self.assertTrue(all(item["top"] == 3 for item in results))
+
 
 if __name__ == "__main__":
     unittest.main()
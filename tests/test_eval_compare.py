@@ -1,8 +1,16 @@
 """Unit tests for the test eval compare module behavior."""
 
+import argparse
+import contextlib
+import io
+from pathlib import Path
+import tempfile
+import time
 import unittest
+from unittest.mock import patch
 
 from summa_technologica.eval_compare import (
+    _run_cases_concurrently,
     evaluate_go_no_go,
     evaluate_v2_metrics,
     is_summa_complete_text,
@@ -98,6 +106,53 @@ class EvalCompareHelperTests(unittest.TestCase):
         metrics = evaluate_v2_metrics(case=case, payload=payload)
         self.assertFalse(metrics["schema_valid"])
 
+    def test_evaluate_v2_metrics_matches_keywords_in_nested_strings(self) -> None:
+        """Verify that evaluate v2 metrics matches keywords in nested strings."""
+        payload = {
+            "question": "Q",
+            "hypotheses": [{"id": "h1", "statement": "Uses Stabilizer Codes."}],
+            "summa_rendering": "",
+        }
+        case = type(
+            "Case",
+            (),
+            {
+                "relevance_keywords": ["stabilizer codes"],
+                "known_bad_pattern": "hypotheses",
+            },
+        )()
+        metrics = evaluate_v2_metrics(case=case, payload=payload)
+        self.assertTrue(metrics["keyword_relevance"])
+        # Payload keys are not part of the searched text.
+        self.assertTrue(metrics["avoids_known_bad_pattern"])
+
+    def test_run_cases_concurrently_keeps_benchmark_order(self) -> None:
+        """Verify that run cases concurrently keeps benchmark order."""
+        cases = [
+            type("Case", (), {"id": f"case-{n}", "domain": "physics"})()
+            for n in range(1, 4)
+        ]
+
+        def fake_run_case_pair(*, case, **_kwargs):
+            # Earlier cases finish last.
+            time.sleep(0.01 * (4 - int(case.id[-1])))
+            return {"benchmark": {"id": case.id}, "v1": {"status": "ok"}}
+
+        args = argparse.Namespace(
+            workers=3, sleep_seconds=0.0, fail_fast=False, objective=None, top=1
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir, patch(
+            "summa_technologica.eval_compare.run_case_pair", fake_run_case_pair
+        ), contextlib.redirect_stdout(io.StringIO()):
+            records = _run_cases_concurrently(args, cases, Path(tmp_dir), None, None)
+            written = sorted(path.name for path in Path(tmp_dir).iterdir())
+
+        self.assertEqual(
+            [record["benchmark"]["id"] for record in records],
+            ["case-1", "case-2", "case-3"],
+        )
+        self.assertEqual(written, ["01_case-1.json", "02_case-2.json", "03_case-3.json"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,69 @@
+"""Unit tests for the test json codec module behavior."""
+
+import io
+import json
+import unittest
+
+from summa_technologica import json_codec
+from summa_technologica.json_codec import (
+    dump,
+    dumps,
+    find_json_object,
+    loads,
+    loads_lenient,
+    strip_code_fence,
+)
+
+
+class JsonCodecTests(unittest.TestCase):
+    def test_dumps_matches_stdlib_output(self) -> None:
+        """Verify that dumps matches stdlib output."""
+        payload = {"title": "Café", "scores": [1, 2.5, None]}
+        self.assertEqual(dumps(payload), json.dumps(payload, separators=(",", ":")))
+        self.assertEqual(dumps(payload, indent=True), json.dumps(payload, indent=2))
+
+    def test_dump_writes_same_text_as_dumps(self) -> None:
+        """Verify that dump writes same text as dumps."""
+        payload = {"title": "Café", "nested": {"ids": [1, 2]}, "empty": []}
+        for indent in (False, True):
+            handle = io.StringIO()
+            dump(payload, handle, indent=indent)
+            self.assertEqual(handle.getvalue(), dumps(payload, indent=indent))
+
+    def test_loads_round_trips_dumps(self) -> None:
+        """Verify that loads round trips dumps."""
+        payload = {"a": [1, {"b": "x"}]}
+        self.assertEqual(loads(dumps(payload)), payload)
+
+    def test_strip_code_fence(self) -> None:
+        """Verify that strip code fence."""
+        self.assertEqual(strip_code_fence('```json\n{"a": 1}\n```'), '{"a": 1}')
+        self.assertEqual(strip_code_fence('{"a": 1}'), '{"a": 1}')
+
+    def test_find_json_object_ignores_braces_in_strings(self) -> None:
+        """Verify that find json object ignores braces in strings."""
+        text = 'Result: {"note": "use {x} and \\"}\\"", "n": {"k": 1}} trailing }'
+        self.assertEqual(
+            find_json_object(text),
+            '{"note": "use {x} and \\"}\\"", "n": {"k": 1}}',
+        )
+        self.assertIsNone(find_json_object("no object here"))
+        self.assertIsNone(find_json_object('{"unterminated": 1'))
+
+    def test_loads_lenient_parses_strict_json(self) -> None:
+        """Verify that loads lenient parses strict json."""
+        self.assertEqual(loads_lenient('{"a": [1, 2]}'), {"a": [1, 2]})
+
+    def test_loads_lenient_raises_strict_error_when_unrecoverable(self) -> None:
+        """Verify that loads lenient raises strict error when unrecoverable."""
+        with self.assertRaises(json.JSONDecodeError):
+            loads_lenient("{not json at all")
+
+    @unittest.skipUnless(json_codec.json5 is not None, "json5 not installed")
+    def test_loads_lenient_recovers_near_json(self) -> None:
+        """Verify that loads lenient recovers near json."""
+        self.assertEqual(loads_lenient("{'a': 1, 'b': [2,],}"), {"a": 1, "b": [2]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 """Unit tests for the test semantic scholar module behavior."""
 
 import json
+import time
 import unittest
 from unittest.mock import patch
 from urllib.error import URLError
@@ -219,6 +220,72 @@ class SemanticScholarSearchTests(unittest.TestCase):
         self.assertLessEqual(len(result.queries), 5)
         self.assertGreaterEqual(len(result.queries), 3)
 
+    @patch("summa_technologica.semantic_scholar.urlopen")
+    def test_retrieve_reuses_prefetched_queries(self, mock_urlopen) -> None:
+        """Verify that retrieve reuses prefetched queries."""
+        mock_urlopen.return_value = _FakeResponse(
+            {
+                "data": [
+                    {
+                        "paperId": "p2",
+                        "title": "Paper Two",
+                        "authors": [{"name": "B"}],
+                        "year": 2021,
+                    }
+                ]
+            }
+        )
+        prefetched_paper = SemanticScholarPaper(
+            paper_id="p1",
+            title="Paper One",
+            authors=["A"],
+            year=2022,
+            abstract="",
+            citation_count=None,
+            doi=None,
+            url=None,
+            source_query="query one",
+        )
+        result = retrieve_grounded_papers(
+            question="query one",
+            refined_query="query two",
+            base_url="https://api.semanticscholar.org",
+            api_key=None,
+            per_query_limit=10,
+            timeout_seconds=1.0,
+            prefetched={"query one": [prefetched_paper]},
+        )
+        self.assertEqual(mock_urlopen.call_count, 1)
+        self.assertEqual({paper.paper_id for paper in result.papers}, {"p1", "p2"})
+
+    @patch("summa_technologica.semantic_scholar.urlopen")
+    def test_retrieve_merges_concurrent_results_in_query_order(self, mock_urlopen) -> None:
+        """Verify that retrieve merges concurrent results in query order."""
+        shared_paper = {
+            "paperId": "p1",
+            "title": "Paper One",
+            "authors": [{"name": "A"}],
+            "year": 2022,
+        }
+
+        def respond(request, timeout):
+            """Answer the first query last so completion order differs from query order."""
+            if "query+one" in request.full_url:
+                time.sleep(0.05)
+            return _FakeResponse({"data": [shared_paper]})
+
+        mock_urlopen.side_effect = respond
+        result = retrieve_grounded_papers(
+            question="query one",
+            refined_query="query two",
+            base_url="https://api.semanticscholar.org",
+            api_key=None,
+            per_query_limit=10,
+            timeout_seconds=1.0,
+        )
+        self.assertEqual(len(result.papers), 1)
+        self.assertEqual(result.papers[0].source_query, "query one")
+
 
 class CitationGroundingTests(unittest.TestCase):
     def test_validate_citations_against_papers(self) -> None:
@@ -273,6 +340,33 @@ class CitationGroundingTests(unittest.TestCase):
         issues = validate_citations_against_papers(citations, papers)
         self.assertEqual(len(issues), 1)
 
+    def test_validate_citations_matches_doi_variants(self) -> None:
+        """Verify that validate citations matches doi variants."""
+        papers = [
+            SemanticScholarPaper(
+                paper_id=None,
+                title="Paper One",
+                authors=["A"],
+                year=2020,
+                abstract="",
+                citation_count=None,
+                doi="DOI:10.1000/X",
+                url=None,
+                source_query="q",
+            )
+        ]
+        self.assertEqual(papers[0].normalized_doi, "10.1000/x")
+        citations = [
+            {
+                "title": "Paper One",
+                "authors": ["A"],
+                "year": 2020,
+                "doi": " 10.1000/x ",
+            }
+        ]
+        issues = validate_citations_against_papers(citations, papers)
+        self.assertEqual(issues, [])
+
 
 if __name__ == "__main__":
     unittest.main()